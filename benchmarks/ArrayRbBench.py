@@ -0,0 +1,54 @@
+import gc
+import random
+import time
+import tracemalloc
+
+from trees.ArrayRbTree import RedBlackTree as ArrayRedBlackTree
+from trees.RbTree import RedBlackTree
+
+SIZES = [100000, 1000000]
+
+
+def bytes_per_node(tree_class, keys):
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    tree = tree_class()
+    for key in keys:
+        tree.insert(key)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tree
+    return (current - start) / len(keys)
+
+
+def throughput(tree_class, keys, queries):
+    tree = tree_class()
+    start = time.perf_counter()
+    for key in keys:
+        tree.insert(key)
+    insert_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for key in queries:
+        tree.find(key)
+    find_time = time.perf_counter() - start
+
+    return len(keys) / insert_time, len(queries) / find_time
+
+
+def main():
+    for size in SIZES:
+        keys = random.sample(range(1, size * 10), size)
+        queries = random.choices(keys, k=size)
+
+        print(f"{size} ключей:")
+        for name, tree_class in (("Узлы-объекты", RedBlackTree), ("Массивы", ArrayRedBlackTree)):
+            memory = bytes_per_node(tree_class, keys)
+            inserts, finds = throughput(tree_class, keys, queries)
+            print(f"  {name:<13} {memory:6.1f} байт/узел, "
+                  f"вставка {inserts:9.0f} оп/с, поиск {finds:9.0f} оп/с")
+
+
+if __name__ == "__main__":
+    main()
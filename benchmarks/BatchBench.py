@@ -0,0 +1,46 @@
+import random
+import time
+
+from trees.RbTree import RedBlackTree
+
+BASE_SIZE = 100000
+BATCH_SIZES = [10000, 100000]
+
+
+def elapsed(action):
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+def one_by_one_insert(tree, keys):
+    for key in keys:
+        tree.insert(key)
+
+
+def one_by_one_delete(tree, keys):
+    for key in keys:
+        tree.delete(key)
+
+
+def main():
+    base = random.sample(range(BASE_SIZE * 10), BASE_SIZE)
+
+    for batch_size in BATCH_SIZES:
+        batch = [random.randrange(BASE_SIZE * 10) for _ in range(batch_size)]
+        doomed = random.sample(base, min(batch_size, BASE_SIZE // 2))
+        print(f"Дерево из {BASE_SIZE} ключей, пакет {batch_size}:")
+
+        for name, single, many, keys in (
+                ("вставка", one_by_one_insert, RedBlackTree.insert_many, batch),
+                ("удаление", one_by_one_delete, RedBlackTree.delete_many, doomed)):
+            tree = RedBlackTree.from_iterable(base)
+            single_time = elapsed(lambda: single(tree, keys))
+            tree = RedBlackTree.from_iterable(base)
+            many_time = elapsed(lambda: many(tree, keys))
+            print(f"  {name:<9} по одному {len(keys) / single_time:9.0f} оп/с, "
+                  f"пакетом {len(keys) / many_time:9.0f} оп/с, x{single_time / many_time:.2f}")
+
+
+if __name__ == "__main__":
+    main()
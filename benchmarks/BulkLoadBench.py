@@ -0,0 +1,57 @@
+import random
+import time
+
+from trees.Bst import BinarySearchTree
+from trees.RbTree import RedBlackTree
+from trees.avlTree import AVLTree
+
+SIZES = [10000, 50000, 1000000]
+
+
+def insert_bst(keys):
+    tree = BinarySearchTree()
+    root = None
+    for key in keys:
+        root = tree.insert(root, key)
+    return root
+
+
+def insert_avl(keys):
+    root = None
+    for key in keys:
+        root = AVLTree.insert(root, key)
+    return root
+
+
+def insert_rb(keys):
+    tree = RedBlackTree()
+    for key in keys:
+        tree.insert(key)
+    return tree
+
+
+def elapsed(build, keys):
+    start = time.perf_counter()
+    build(keys)
+    return time.perf_counter() - start
+
+
+def main():
+    rows = [
+        ("BST", insert_bst, BinarySearchTree.from_iterable),
+        ("AVL", insert_avl, AVLTree.from_iterable),
+        ("RB", insert_rb, RedBlackTree.from_iterable),
+    ]
+
+    for size in SIZES:
+        keys = random.sample(range(1, size + 1), size)
+        print(f"{size} ключей:")
+        for name, insert_all, from_iterable in rows:
+            one_by_one = elapsed(insert_all, keys)
+            bulk = elapsed(from_iterable, keys)
+            print(f"  {name:<4} по одному {one_by_one * 1000:9.1f} мс, from_iterable {bulk * 1000:8.1f} мс, "
+                  f"ускорение x{one_by_one / bulk:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from trees.ConcurrentRbTree import ConcurrentRedBlackTree
+from trees.RbTree import RedBlackTree
+
+SIZE = 100000
+OPS_PER_THREAD = 20000
+THREADS = [1, 2, 4, 8]
+READ_RATIOS = [0.5, 0.9, 0.99]
+BATCHES = [1, 32]
+
+
+class MutexRedBlackTree:
+    # Для сравнения: одна обычная блокировка на все операции.
+    def __init__(self, tree):
+        self.tree = tree
+        self.lock = threading.Lock()
+
+    def find(self, key):
+        with self.lock:
+            return self.tree.find(key)
+
+    def insert_many(self, keys):
+        with self.lock:
+            self.tree.insert_many(keys)
+
+    def delete_many(self, keys):
+        with self.lock:
+            self.tree.delete_many(keys)
+
+
+def worker(tree, seed, read_ratio, batch):
+    rng = random.Random(seed)
+    # У каждого потока свои новые ключи, чтобы удалять только то, что он сам вставил.
+    fresh = iter(range(SIZE * 10 + seed * OPS_PER_THREAD, SIZE * 10 + (seed + 1) * OPS_PER_THREAD))
+    inserted = []
+    pending = []
+
+    for _ in range(OPS_PER_THREAD):
+        if rng.random() < read_ratio:
+            tree.find(rng.randrange(SIZE * 10))
+            continue
+
+        pending.append(next(fresh))
+        if len(pending) >= batch:
+            if inserted and rng.random() < 0.5:
+                tree.delete_many(inserted[-len(pending):])
+                del inserted[-len(pending):]
+            else:
+                tree.insert_many(pending)
+                inserted.extend(pending)
+            pending = []
+
+    if pending:
+        tree.insert_many(pending)
+        inserted.extend(pending)
+    return len(inserted)
+
+
+def run(wrapper, threads, read_ratio, batch, base):
+    tree = wrapper(RedBlackTree.from_sorted(base))
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        futures = [pool.submit(worker, tree, seed, read_ratio, batch) for seed in range(threads)]
+        kept = sum(future.result() for future in futures)
+    elapsed = time.perf_counter() - start
+
+    if len(tree.tree) != SIZE + kept:
+        raise RuntimeError("Размер дерева не сошелся после параллельной работы")
+    return threads * OPS_PER_THREAD / elapsed
+
+
+def main():
+    base = sorted(random.sample(range(SIZE * 10), SIZE))
+
+    print(f"Дерево из {SIZE} ключей, {OPS_PER_THREAD} операций на поток, оп/с:")
+    print(f"{'потоки':>7} {'чтения':>7} {'пакет':>6} {'RW-блокировка':>14} {'мьютекс':>10}")
+    for read_ratio in READ_RATIOS:
+        for batch in BATCHES:
+            for threads in THREADS:
+                rw = run(ConcurrentRedBlackTree, threads, read_ratio, batch, base)
+                mutex = run(MutexRedBlackTree, threads, read_ratio, batch, base)
+                print(f"{threads:>7} {read_ratio:>7.0%} {batch:>6} {rw:>14.0f} {mutex:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
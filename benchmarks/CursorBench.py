@@ -0,0 +1,75 @@
+import random
+import time
+import tracemalloc
+
+from trees.RbTree import RedBlackTree
+from trees.avlTree import AVLTree
+
+SIZE = 100000
+
+
+def join_cursors(a, b):
+    # Общие ключи двух деревьев: курсоры идут рядом, отстающий делает шаг вперед
+    count = 0
+    a.seek_first()
+    b.seek_first()
+    while a.valid and b.valid:
+        if a.key < b.key:
+            a.next()
+        elif b.key < a.key:
+            b.next()
+        else:
+            count += 1
+            a.next()
+            b.next()
+    return count
+
+
+def join_lists(a, b):
+    a = list(a)
+    b = list(b)
+    count = i = j = 0
+    while i < len(a) and j < len(b):
+        if a[i] < b[j]:
+            i += 1
+        elif b[j] < a[i]:
+            j += 1
+        else:
+            count += 1
+            i += 1
+            j += 1
+    return count
+
+
+def measure(action):
+    # Время - без tracemalloc, он сильно замедляет выделения памяти; пик памяти - отдельным прогоном
+    start = time.perf_counter()
+    result = action()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    action()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    left = random.sample(range(SIZE * 4), SIZE)
+    right = random.sample(range(SIZE * 4), SIZE)
+    rb_left, rb_right = RedBlackTree.from_iterable(left), RedBlackTree.from_iterable(right)
+    avl_left, avl_right = AVLTree.from_iterable(left), AVLTree.from_iterable(right)
+
+    print(f"Пересечение двух деревьев по {SIZE} ключей:")
+    for name, action in (
+            ("RB курсоры", lambda: join_cursors(rb_left.cursor(), rb_right.cursor())),
+            ("RB списки обходов", lambda: join_lists(rb_left.iter_in_order(rb_left.root),
+                                                     rb_right.iter_in_order(rb_right.root))),
+            ("AVL курсоры", lambda: join_cursors(AVLTree.cursor(avl_left), AVLTree.cursor(avl_right))),
+            ("AVL списки обходов", lambda: join_lists(AVLTree.iter_in_order(avl_left),
+                                                      AVLTree.iter_in_order(avl_right)))):
+        result, elapsed, peak = measure(action)
+        print(f"  {name:<20} общих {result}, {elapsed:.3f} с, пик памяти {peak / 1024:8.1f} КБ")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+from trees.ArrayRbTree import RedBlackTree as ArrayRedBlackTree
+from trees.BTree import BTree
+from trees.Bst import BinarySearchTree
+from trees.RbTree import RedBlackTree
+from trees.avlTree import AVLTree
+
+# Единый интерфейс над деревьями для benchmarks/Runner.py: insert/find/delete по ключу,
+# load для быстрой подготовки, traverse(order) для обходов и height() для сравнения высот.
+# stats = False - движок не поддерживает счетчики trees.Stats (Runner --stats).
+
+TRAVERSALS = ('pre_order', 'in_order', 'post_order', 'bfs')
+
+
+class BstEngine:
+    name = 'bst'
+    operations = ('insert', 'find', 'delete') + TRAVERSALS
+
+    def __init__(self):
+        self.tree = BinarySearchTree()
+        self.root = None
+
+    def load(self, keys):
+        self.root = BinarySearchTree.from_iterable(keys)
+
+    def insert(self, key):
+        self.root = self.tree.insert(self.root, key)
+
+    def find(self, key):
+        return self.tree.find(self.root, key)
+
+    def delete(self, key):
+        self.root = self.tree.delete(self.root, key)
+
+    def traverse(self, order):
+        return getattr(self.tree, f'iter_{order}')(self.root)
+
+    def height(self):
+        return self.tree.height(self.root)
+
+
+class AvlEngine:
+    name = 'avl'
+    operations = ('insert', 'find', 'delete') + TRAVERSALS
+
+    def __init__(self):
+        self.root = None
+
+    def load(self, keys):
+        self.root = AVLTree.from_iterable(keys)
+
+    def insert(self, key):
+        self.root = AVLTree.insert(self.root, key)
+
+    def find(self, key):
+        return AVLTree.find(self.root, key)
+
+    def delete(self, key):
+        self.root = AVLTree.delete(self.root, key)
+
+    def traverse(self, order):
+        return getattr(AVLTree, f'iter_{order}')(self.root)
+
+    def height(self):
+        return AVLTree.get_height(self.root)
+
+
+class RbEngine:
+    name = 'rb'
+    operations = ('insert', 'find', 'delete') + TRAVERSALS
+
+    def __init__(self):
+        self.tree = RedBlackTree()
+
+    def load(self, keys):
+        self.tree = RedBlackTree.from_iterable(keys)
+
+    def insert(self, key):
+        self.tree.insert(key)
+
+    def find(self, key):
+        return self.tree.find(key)
+
+    def delete(self, key):
+        self.tree.delete(key)
+
+    def traverse(self, order):
+        return getattr(self.tree, f'iter_{order}')(self.tree.root)
+
+    def height(self):
+        return self.tree.height()
+
+
+class ArrayRbEngine:
+    name = 'rb-array'
+    operations = ('insert', 'find', 'delete')
+    # Ключи лежат в array('q'): обертки CountingKey туда не положить, счетчиков нет
+    stats = False
+
+    def __init__(self):
+        self.tree = ArrayRedBlackTree()
+
+    def load(self, keys):
+        for key in keys:
+            self.tree.insert(key)
+
+    def insert(self, key):
+        self.tree.insert(key)
+
+    def find(self, key):
+        return self.tree.find(key)
+
+    def delete(self, key):
+        self.tree.delete(key)
+
+
+class BTreeEngine:
+    # B+-дерево - множество: повторные ключи не добавляются. Обход только симметричный, по цепочке листьев.
+    name = 'btree'
+    operations = ('insert', 'find', 'delete', 'in_order')
+    fanout = 64
+
+    def __init__(self):
+        self.tree = BTree(self.fanout)
+
+    def load(self, keys):
+        self.tree = BTree.from_iterable(keys, self.fanout)
+
+    def insert(self, key):
+        self.tree.insert(key)
+
+    def find(self, key):
+        return self.tree.find(key)
+
+    def delete(self, key):
+        self.tree.delete(key)
+
+    def traverse(self, order):
+        return self.tree.iter_in_order()
+
+    def height(self):
+        return self.tree.height()
+
+
+ENGINES = {engine.name: engine for engine in (BstEngine, AvlEngine, RbEngine, ArrayRbEngine, BTreeEngine)}
+OPERATIONS = ('insert', 'find', 'delete') + TRAVERSALS
@@ -0,0 +1,48 @@
+import random
+import time
+
+import numpy as np
+
+from trees.Bst import BinarySearchTree
+from trees.RbTree import RedBlackTree
+from trees.avlTree import AVLTree
+
+SIZE = 1000000
+QUERIES = 1000000
+LOOP_QUERIES = 100000
+
+
+def elapsed(action):
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+def main():
+    keys = random.sample(range(SIZE * 10), SIZE)
+    queries = np.random.randint(0, SIZE * 10, QUERIES)
+    loop_queries = queries[:LOOP_QUERIES].tolist()
+
+    bst = BinarySearchTree()
+    bst_root = BinarySearchTree.from_iterable(keys)
+    avl_root = AVLTree.from_iterable(keys)
+    rb = RedBlackTree.from_iterable(keys)
+
+    rows = [
+        ("BST", lambda: bst.freeze(bst_root), lambda key: bst.find(bst_root, key)),
+        ("AVL", lambda: AVLTree.freeze(avl_root), lambda key: AVLTree.find(avl_root, key)),
+        ("RB", rb.freeze, rb.find),
+    ]
+
+    print(f"{SIZE} ключей, {QUERIES} запросов:")
+    for name, freeze, find in rows:
+        freeze_time = elapsed(freeze)
+        index = freeze()
+        batch_time = elapsed(lambda: index.contains_many(queries))
+        loop_time = elapsed(lambda: [find(key) for key in loop_queries]) * QUERIES / LOOP_QUERIES
+        print(f"  {name:<4} freeze {freeze_time:6.2f} с, contains_many {batch_time:6.2f} с, "
+              f"find по одному ~{loop_time:6.2f} с")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+import random
+import sys
+import time
+
+from trees.Bst import BinarySearchTree, TreeNode as BstNode
+from trees.avlTree import AVLTree, TreeNode as AvlNode
+
+SIZE = 100000
+SORTED_AVL_SIZE = 1000000
+SORTED_BST_SIZE = 5000
+
+
+# Рекурсивные версии операций в том виде, в каком они были до перехода на циклы.
+def recursive_bst_insert(node, key):
+    if node is None:
+        return BstNode(key)
+
+    if key < node.key:
+        node.left = recursive_bst_insert(node.left, key)
+    else:
+        node.right = recursive_bst_insert(node.right, key)
+
+    return node
+
+
+def recursive_bst_find(node, key):
+    if node is None or node.key == key:
+        return node
+
+    if key < node.key:
+        return recursive_bst_find(node.left, key)
+
+    return recursive_bst_find(node.right, key)
+
+
+def recursive_bst_delete(root, key):
+    if root is None:
+        return root
+
+    if key < root.key:
+        root.left = recursive_bst_delete(root.left, key)
+    elif key > root.key:
+        root.right = recursive_bst_delete(root.right, key)
+    else:
+        if root.left is None:
+            return root.right
+        elif root.right is None:
+            return root.left
+
+        temp = root.right
+        while temp.left is not None:
+            temp = temp.left
+        root.key = temp.key
+        root.right = recursive_bst_delete(root.right, temp.key)
+
+    return root
+
+
+def recursive_avl_fix(node):
+    node.height = 1 + max(AVLTree.get_height(node.left), AVLTree.get_height(node.right))
+    balance = AVLTree.get_balance(node)
+
+    if balance > 1 and AVLTree.get_balance(node.left) >= 0:
+        return AVLTree.right_rotate(node)
+
+    if balance < -1 and AVLTree.get_balance(node.right) <= 0:
+        return AVLTree.left_rotate(node)
+
+    if balance > 1:
+        node.left = AVLTree.left_rotate(node.left)
+        return AVLTree.right_rotate(node)
+
+    if balance < -1:
+        node.right = AVLTree.right_rotate(node.right)
+        return AVLTree.left_rotate(node)
+
+    return node
+
+
+def recursive_avl_insert(node, key):
+    if not node:
+        return AvlNode(key)
+
+    if key < node.key:
+        node.left = recursive_avl_insert(node.left, key)
+    else:
+        node.right = recursive_avl_insert(node.right, key)
+
+    return recursive_avl_fix(node)
+
+
+def recursive_avl_find(node, key):
+    if not node or node.key == key:
+        return node
+
+    if key < node.key:
+        return recursive_avl_find(node.left, key)
+
+    return recursive_avl_find(node.right, key)
+
+
+def recursive_avl_delete(root, key):
+    if not root:
+        return root
+
+    if key < root.key:
+        root.left = recursive_avl_delete(root.left, key)
+    elif key > root.key:
+        root.right = recursive_avl_delete(root.right, key)
+    else:
+        if not root.left:
+            return root.right
+        elif not root.right:
+            return root.left
+
+        temp = AVLTree.min_value_node(root.right)
+        root.key = temp.key
+        root.right = recursive_avl_delete(root.right, temp.key)
+
+    return recursive_avl_fix(root)
+
+
+def measure(insert, find, delete, keys):
+    root = None
+    times = {}
+
+    start = time.perf_counter()
+    for key in keys:
+        root = insert(root, key)
+    times['insert'] = (time.perf_counter() - start) / len(keys)
+
+    start = time.perf_counter()
+    for key in keys:
+        find(root, key)
+    times['find'] = (time.perf_counter() - start) / len(keys)
+
+    start = time.perf_counter()
+    for key in keys:
+        root = delete(root, key)
+    times['delete'] = (time.perf_counter() - start) / len(keys)
+
+    return times
+
+
+def report(name, recursive, iterative):
+    print(f"{name}:")
+    for operation in ('insert', 'find', 'delete'):
+        old = recursive[operation] * 1e6
+        new = iterative[operation] * 1e6
+        print(f"  {operation:<7} рекурсивно {old:8.3f} мкс, итеративно {new:8.3f} мкс, ускорение x{old / new:.2f}")
+
+
+def main():
+    keys = random.sample(range(1, SIZE * 10), SIZE)
+    bst = BinarySearchTree()
+
+    report(
+        "BST",
+        measure(recursive_bst_insert, recursive_bst_find, recursive_bst_delete, keys),
+        measure(bst.insert, bst.find, bst.delete, keys),
+    )
+    report(
+        "AVL",
+        measure(recursive_avl_insert, recursive_avl_find, recursive_avl_delete, keys),
+        measure(AVLTree.insert, AVLTree.find, AVLTree.delete, keys),
+    )
+
+    root = None
+    try:
+        for key in range(SORTED_BST_SIZE):
+            root = recursive_bst_insert(root, key)
+        print(f"Рекурсивный BST: {SORTED_BST_SIZE} упорядоченных ключей вставлены")
+    except RecursionError:
+        print(f"Рекурсивный BST: RecursionError при лимите {sys.getrecursionlimit()}")
+
+    root = None
+    start = time.perf_counter()
+    for key in range(SORTED_BST_SIZE):
+        root = bst.insert(root, key)
+    print(f"Итеративный BST: {SORTED_BST_SIZE} упорядоченных ключей за {time.perf_counter() - start:.2f} с")
+
+    root = None
+    start = time.perf_counter()
+    for key in range(SORTED_AVL_SIZE):
+        root = AVLTree.insert(root, key)
+    print(f"Итеративный AVL: {SORTED_AVL_SIZE} упорядоченных ключей за {time.perf_counter() - start:.2f} с, "
+          f"высота {AVLTree.get_height(root)}")
+
+
+if __name__ == "__main__":
+    main()
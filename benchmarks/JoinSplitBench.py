@@ -0,0 +1,35 @@
+import random
+import time
+
+from trees.RbTree import RedBlackTree
+from trees.avlTree import AVLTree
+
+SIZES = [10000, 100000, 1000000]
+ROUNDS = 200
+
+
+def main():
+    print(f"split + join по случайному ключу, среднее по {ROUNDS} разам:")
+    for size in SIZES:
+        keys = range(0, size * 2, 2)
+        avl_root = AVLTree.from_sorted(keys)
+        rb = RedBlackTree.from_sorted(keys)
+        splits = [random.randrange(1, size * 2, 2) for _ in range(ROUNDS)]
+
+        start = time.perf_counter()
+        for key in splits:
+            left, right = AVLTree.split(avl_root, key)
+            avl_root = AVLTree.join(left, key, right)
+        avl_time = (time.perf_counter() - start) / ROUNDS
+
+        start = time.perf_counter()
+        for key in splits:
+            left, right = rb.split(key)
+            rb = RedBlackTree.join(left, key, right)
+        rb_time = (time.perf_counter() - start) / ROUNDS
+
+        print(f"  n={size:<8} AVL {avl_time * 1e6:7.1f} мкс, RB {rb_time * 1e6:7.1f} мкс")
+
+
+if __name__ == "__main__":
+    main()
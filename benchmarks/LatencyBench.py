@@ -0,0 +1,85 @@
+import argparse
+import gc
+import json
+import random
+
+from benchmarks.Engines import ENGINES
+from trees.Latency import InstrumentedTree, PERCENTILES
+
+# Смешанная нагрузка на заранее заполненное дерево: поиск, вставка и удаление вперемешку,
+# время каждой операции - в гистограмму своего типа. Хвосты (p99, max) видны отдельно от медианы.
+
+
+def run(engine_class, options, rng):
+    keys = rng.sample(range(options.size * 10), options.size)
+    engine = engine_class()
+    engine.load(keys)
+    tree = InstrumentedTree(engine)
+    live = keys[:]
+    present = set(keys)
+
+    weights = [options.find, options.insert, options.delete]
+    kinds = rng.choices(('find', 'insert', 'delete'), weights, k=options.count)
+
+    enabled = gc.isenabled()
+    if not options.gc:
+        gc.disable()
+    try:
+        for kind in kinds:
+            if kind == 'find' or (kind == 'delete' and not live):
+                tree.find(live[rng.randrange(len(live))] if live else 0)
+            elif kind == 'insert':
+                key = rng.randrange(options.size * 10, options.size * 10 ** 3)
+                while key in present:
+                    key = rng.randrange(options.size * 10, options.size * 10 ** 3)
+                present.add(key)
+                live.append(key)
+                tree.insert(key)
+            else:
+                # удаляется случайный существующий ключ, список живых ключей сжимается перестановкой с концом
+                i = rng.randrange(len(live))
+                live[i], live[-1] = live[-1], live[i]
+                key = live.pop()
+                present.discard(key)
+                tree.delete(key)
+    finally:
+        if enabled:
+            gc.enable()
+
+    return tree.recorder.summary()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Гистограммы задержек операций под смешанной нагрузкой")
+    parser.add_argument('--engines', nargs='+', choices=list(ENGINES), default=['bst', 'avl', 'rb', 'btree'])
+    parser.add_argument('--size', type=int, default=100000, help="ключей в дереве перед нагрузкой")
+    parser.add_argument('--count', type=int, default=200000, help="число операций")
+    parser.add_argument('--find', type=float, default=50, help="доля поиска")
+    parser.add_argument('--insert', type=float, default=25, help="доля вставок")
+    parser.add_argument('--delete', type=float, default=25, help="доля удалений")
+    parser.add_argument('--gc', action='store_true', help="не отключать сборщик мусора во время замера")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    options = parse_args(argv)
+    results = {}
+
+    for name in options.engines:
+        summary = run(ENGINES[name], options, random.Random(options.seed))
+        results[name] = summary
+        for operation, row in summary.items():
+            percentiles = ", ".join(f"p{p} {row[f'p{p}_ns'] / 1000:7.2f}" for p in PERCENTILES)
+            print(f"{name:<9} {operation:<7} {row['count']:>8} оп, мкс: {percentiles}, max {row['max_ns'] / 1000:9.2f}")
+
+    if options.json:
+        with open(options.json, 'w', encoding='utf-8') as file:
+            json.dump(results, file, ensure_ascii=False, indent=2)
+
+    return results
+
+
+if __name__ == "__main__":
+    main()
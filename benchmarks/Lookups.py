@@ -0,0 +1,25 @@
+import random
+import time
+
+# Общие части замеров поиска: набор запросов с заданной долей промахов и среднее время на запрос.
+# Ими пользуются benchmarks/SearchBench.py и демонстрация orders/AvlTreeSearchOrder.py.
+
+
+def make_queries(keys, count, miss_ratio):
+    # Отсутствующие ключи берутся за пределами диапазона вставленных.
+    absent_key = max(keys) + 1
+    queries = []
+    for key in random.choices(keys, k=count):
+        if random.random() < miss_ratio:
+            queries.append(absent_key)
+            absent_key += 1
+        else:
+            queries.append(key)
+    return queries
+
+
+def time_lookups(search, queries):
+    start = time.perf_counter()
+    for key in queries:
+        search(key)
+    return (time.perf_counter() - start) / len(queries)
@@ -0,0 +1,103 @@
+import gc
+import random
+import tracemalloc
+
+import trees.Bst as bst_module
+import trees.RbTree as rb_module
+import trees.avlTree as avl_module
+
+SIZE = 50000
+
+
+# Узлы с __dict__ с теми же полями, что и у узлов на __slots__.
+class DictBstNode:
+    def __init__(self, key):
+        self.key = key
+        self.left = None
+        self.right = None
+        self.count = 1
+
+
+class DictAvlNode:
+    def __init__(self, key):
+        self.key = key
+        self.left = None
+        self.right = None
+        self.height = 1
+        self.size = 1
+        self.count = 1
+
+
+class DictRbNode:
+    def __init__(self, key):
+        self.key = key
+        self.color = rb_module.RED
+        self.left = None
+        self.right = None
+        self.parent = None
+        self.height = 1
+        self.size = 1
+        self.count = 1
+
+
+def build_bst(keys):
+    tree = bst_module.BinarySearchTree()
+    root = None
+    for key in keys:
+        root = tree.insert(root, key)
+    return root
+
+
+def build_avl(keys):
+    root = None
+    for key in keys:
+        root = avl_module.AVLTree.insert(root, key)
+    return root
+
+
+def build_rb(keys):
+    tree = rb_module.RedBlackTree()
+    for key in keys:
+        tree.insert(key)
+    return tree
+
+
+def bytes_per_node(build, keys):
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    tree = build(keys)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tree
+    return (current - start) / len(keys)
+
+
+def measure(module, node_class, build, keys):
+    original = module.TreeNode
+    module.TreeNode = node_class
+    try:
+        return bytes_per_node(build, keys)
+    finally:
+        module.TreeNode = original
+
+
+def main():
+    # Ключи создаются заранее, чтобы в замер попали только узлы.
+    keys = random.sample(range(1, SIZE * 10), SIZE)
+
+    rows = [
+        ("BST", bst_module, DictBstNode, build_bst),
+        ("AVL", avl_module, DictAvlNode, build_avl),
+        ("RB", rb_module, DictRbNode, build_rb),
+    ]
+
+    print(f"Байт на узел при {SIZE} ключах:")
+    for name, module, dict_node, build in rows:
+        before = measure(module, dict_node, build, keys)
+        after = bytes_per_node(build, keys)
+        print(f"  {name:<4} __dict__ {before:7.1f}, __slots__ {after:7.1f}, экономия {100 * (1 - after / before):.0f}%")
+
+
+if __name__ == "__main__":
+    main()
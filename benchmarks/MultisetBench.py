@@ -0,0 +1,78 @@
+import gc
+import random
+import time
+import tracemalloc
+
+from trees.RbTree import RedBlackTree
+from trees.avlTree import AVLTree, MultisetAVLTree
+
+SIZE = 200000
+DISTINCT = [100, 1000, 10000]
+
+
+def build_rb(multiset):
+    def build(keys):
+        tree = RedBlackTree(multiset)
+        for key in keys:
+            tree.insert(key)
+        return tree
+    return build
+
+
+def build_avl(insert):
+    def build(keys):
+        root = None
+        for key in keys:
+            root = insert(root, key)
+        return root
+    return build
+
+
+def measure(build, keys):
+    # Время построения и память под узлы по tracemalloc. Трассировка замедляет каждое выделение
+    # памяти, поэтому время меряется на отдельном построении без нее.
+    gc.collect()
+    start = time.perf_counter()
+    tree = build(keys)
+    elapsed = time.perf_counter() - start
+
+    del tree
+    gc.collect()
+    tracemalloc.start()
+    tree = build(keys)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return tree, elapsed, memory
+
+
+def main():
+    for distinct in DISTINCT:
+        keys = [random.randrange(distinct) for _ in range(SIZE)]
+        probes = random.sample(keys, 10000)
+        print(f"{SIZE} ключей, различных {distinct}:")
+
+        for name, multiset in (("RB по узлу на копию", False), ("RB multiset", True)):
+            tree, elapsed, memory = measure(build_rb(multiset), keys)
+            start = time.perf_counter()
+            for key in probes:
+                tree.find(key)
+            find_time = time.perf_counter() - start
+            nodes = sum(1 for _ in tree.iter_in_order(tree.root))
+            print(f"  {name:<22} узлов {nodes:>7}, "
+                  f"высота {tree.height():>3}, {memory / 2 ** 20:6.1f} МБ, "
+                  f"вставка {SIZE / elapsed:8.0f} оп/с, поиск {len(probes) / find_time:8.0f} оп/с")
+
+        for name, insert in (("AVL по узлу на копию", AVLTree.insert), ("AVL multiset", MultisetAVLTree.insert)):
+            root, elapsed, memory = measure(build_avl(insert), keys)
+            start = time.perf_counter()
+            for key in probes:
+                AVLTree.find(root, key)
+            find_time = time.perf_counter() - start
+            nodes = sum(1 for _ in AVLTree.iter_in_order(root))
+            print(f"  {name:<22} узлов {nodes:>7}, "
+                  f"высота {AVLTree.get_height(root):>3}, {memory / 2 ** 20:6.1f} МБ, "
+                  f"вставка {SIZE / elapsed:8.0f} оп/с, поиск {len(probes) / find_time:8.0f} оп/с")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import math
+import random
+import time
+
+from trees.RbTree import RedBlackTree
+from trees.avlTree import AVLTree
+
+SIZE = 100000
+QUERIES = 200
+
+
+def traversal_percentile(keys, p):
+    k = min(len(keys) - 1, max(0, math.ceil(p / 100 * len(keys)) - 1))
+    return keys[k]
+
+
+def per_query(action, queries):
+    start = time.perf_counter()
+    for p in queries:
+        action(p)
+    return (time.perf_counter() - start) / len(queries)
+
+
+def main():
+    keys = random.sample(range(1, SIZE * 10), SIZE)
+    queries = [random.uniform(0, 100) for _ in range(QUERIES)]
+
+    tree = RedBlackTree.from_iterable(keys)
+    root = AVLTree.from_iterable(keys)
+
+    rows = [
+        ("RB  обход", lambda p: traversal_percentile(list(tree.iter_in_order(tree.root)), p)),
+        ("RB  select", tree.percentile),
+        ("AVL обход", lambda p: traversal_percentile(list(AVLTree.iter_in_order(root)), p)),
+        ("AVL select", lambda p: AVLTree.percentile(root, p)),
+    ]
+
+    print(f"Перцентиль на дереве из {SIZE} ключей, {QUERIES} запросов:")
+    for name, action in rows:
+        print(f"  {name:<11} {per_query(action, queries) * 1e6:10.1f} мкс на запрос")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import random
+import threading
+import time
+import tracemalloc
+
+from trees.PersistentAvlTree import PersistentAVLTree
+from trees.avlTree import AVLTree
+
+SIZE = 100000
+OPERATIONS = 20000
+
+
+def per_op(action, keys):
+    start = time.perf_counter()
+    action(keys)
+    return (time.perf_counter() - start) / len(keys)
+
+
+def allocated_per_op(action, keys):
+    tracemalloc.start()
+    action(keys)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / len(keys)
+
+
+def snapshot_reader(root, writes):
+    # Читатель обходит снимок, пока писатель вставляет новые ключи.
+    seen = []
+    reader = threading.Thread(target=lambda: seen.append(sum(1 for _ in PersistentAVLTree.iter_in_order(root))))
+    reader.start()
+    current = root
+    for key in writes:
+        current = PersistentAVLTree.insert(current, key)
+    reader.join()
+    return seen[0], current.size
+
+
+def main():
+    base = random.sample(range(SIZE * 10), SIZE)
+    inserts = [random.randrange(SIZE * 10) for _ in range(OPERATIONS)]
+    deletes = random.sample(base, OPERATIONS)
+
+    for name, tree in (("AVL на месте", AVLTree), ("персистентное", PersistentAVLTree)):
+        state = {}
+
+        def prepare():
+            state['root'] = tree.from_iterable(base)
+
+        def insert_all(keys):
+            root = state['root']
+            for key in keys:
+                root = tree.insert(root, key)
+            state['root'] = root
+
+        def delete_all(keys):
+            root = state['root']
+            for key in keys:
+                root = tree.delete(root, key)
+            state['root'] = root
+
+        prepare()
+        insert_time = per_op(insert_all, inserts)
+        prepare()
+        delete_time = per_op(delete_all, deletes)
+        prepare()
+        insert_bytes = allocated_per_op(insert_all, inserts)
+
+        print(f"{name:<14} вставка {insert_time * 1e6:6.2f} мкс, удаление {delete_time * 1e6:6.2f} мкс, "
+              f"{insert_bytes:7.0f} байт прироста памяти на вставку")
+
+    snapshot_size, final_size = snapshot_reader(PersistentAVLTree.from_iterable(base), inserts)
+    print(f"Снимок из {SIZE} ключей прочитан целиком ({snapshot_size}), "
+          f"пока в новую версию вставлялось {OPERATIONS} ключей (стало {final_size})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import heapq
+import random
+import time
+
+from trees.RbTree import RedBlackTree
+
+SIZES = [10000, 100000]
+
+
+def elapsed(action):
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+def heap_pops(keys):
+    heap = list(keys)
+    heapq.heapify(heap)
+    return lambda: [heapq.heappop(heap) for _ in range(len(keys))]
+
+
+def tree_pops(keys):
+    tree = RedBlackTree.from_iterable(keys)
+    return lambda: [tree.pop_min() for _ in range(len(keys))]
+
+
+def tree_search_pops(keys):
+    # Как раньше: наименьший узел от корня, затем delete(key) с повторным поиском
+    tree = RedBlackTree.from_iterable(keys)
+
+    def action():
+        for _ in range(len(keys)):
+            tree.delete(tree.min_value_node(tree.root).key)
+
+    return action
+
+
+def heap_mixed(keys):
+    # Планировщик: взять ближайшую задачу и поставить новую позже
+    heap = list(keys)
+    heapq.heapify(heap)
+
+    def action():
+        for key in keys:
+            heapq.heappush(heap, heapq.heappop(heap) + key)
+
+    return action
+
+
+def tree_mixed(keys):
+    tree = RedBlackTree.from_iterable(keys)
+
+    def action():
+        for key in keys:
+            tree.insert(tree.pop_min() + key)
+
+    return action
+
+
+def main():
+    for size in SIZES:
+        keys = random.sample(range(size * 10), size)
+        print(f"{size} ключей:")
+        for name, prepare in (("heapq pop", heap_pops), ("RB pop_min", tree_pops),
+                              ("RB min + delete(key)", tree_search_pops),
+                              ("heapq pop + push", heap_mixed), ("RB pop_min + insert", tree_mixed)):
+            action = prepare(keys)
+            seconds = elapsed(action)
+            print(f"  {name:<22} {size / seconds:10.0f} оп/с")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import random
+import time
+
+from trees.Bst import BinarySearchTree
+from trees.RbTree import RedBlackTree
+from trees.avlTree import AVLTree
+
+SIZE = 1000000
+RANGE_WIDTH = 100
+SCANS = 1000
+FULL_SCANS = 3
+
+
+def per_scan(scan, ranges):
+    start = time.perf_counter()
+    for low, high in ranges:
+        scan(low, high)
+    return (time.perf_counter() - start) / len(ranges)
+
+
+def main():
+    keys = range(0, SIZE * 2, 2)
+    ranges = []
+    for _ in range(SCANS):
+        low = random.randrange(0, SIZE * 2)
+        ranges.append((low, low + RANGE_WIDTH))
+
+    bst = BinarySearchTree()
+    bst_root = BinarySearchTree.from_sorted(keys)
+    avl_root = AVLTree.from_sorted(keys)
+    rb = RedBlackTree.from_sorted(keys)
+
+    rows = [
+        ("BST", lambda low, high: list(bst.range(bst_root, low, high)),
+         lambda low, high: [key for key in bst.iter_in_order(bst_root) if low <= key <= high]),
+        ("AVL", lambda low, high: list(AVLTree.range(avl_root, low, high)),
+         lambda low, high: [key for key in AVLTree.iter_in_order(avl_root) if low <= key <= high]),
+        ("RB", lambda low, high: list(rb.range(low, high)),
+         lambda low, high: [key for key in rb.iter_in_order(rb.root) if low <= key <= high]),
+    ]
+
+    print(f"{SIZE} ключей, диапазоны шириной {RANGE_WIDTH} (~{RANGE_WIDTH // 2} ключей):")
+    for name, scan, full_scan in rows:
+        scan_time = per_scan(scan, ranges)
+        full_time = per_scan(full_scan, ranges[:FULL_SCANS])
+        print(f"  {name:<4} range {scan_time * 1e6:8.1f} мкс, полный обход с фильтром {full_time * 1e6:10.1f} мкс")
+
+    print(f"  AVL count_range {per_scan(lambda low, high: AVLTree.count_range(avl_root, low, high), ranges) * 1e6:.1f} мкс")
+    print(f"  RB  count_range {per_scan(rb.count_range, ranges) * 1e6:.1f} мкс")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+import argparse
+import csv
+import gc
+import json
+import random
+import time
+from collections import deque
+
+from benchmarks.Engines import ENGINES, OPERATIONS, TRAVERSALS, BTreeEngine
+from trees.Stats import COUNTERS, OperationStats, counting
+
+DISTRIBUTIONS = ('random', 'sorted', 'duplicates')
+
+
+def make_keys(size, distribution, rng):
+    if distribution == 'sorted':
+        return list(range(1, size + 1))
+    if distribution == 'duplicates':
+        return [rng.randint(1, max(1, size // 10)) for _ in range(size)]
+    return rng.sample(range(1, size * 10 + 1), size)
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+def build(engine_class, keys, bulk_load):
+    engine = engine_class()
+    if bulk_load:
+        engine.load(keys)
+    else:
+        for key in keys:
+            engine.insert(key)
+    return engine
+
+
+def timed(action, keep_gc):
+    gc.collect()
+    enabled = gc.isenabled()
+    if not keep_gc:
+        gc.disable()
+    try:
+        start = time.perf_counter_ns()
+        action()
+        return time.perf_counter_ns() - start
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def run_once(engine_class, operation, keys, queries, prepared, options):
+    # Возвращает время в наносекундах и число выполненных операций.
+    if operation == 'insert':
+        engine = engine_class()
+        insert = engine.insert
+
+        def action():
+            for key in keys:
+                insert(key)
+
+        return timed(action, options.gc), len(keys)
+
+    if operation == 'delete':
+        engine = build(engine_class, keys, options.bulk_load)
+        delete = engine.delete
+
+        def action():
+            for key in queries:
+                delete(key)
+
+        return timed(action, options.gc), len(queries)
+
+    if operation == 'find':
+        find = prepared.find
+
+        def action():
+            for key in queries:
+                find(key)
+
+        return timed(action, options.gc), len(queries)
+
+    return timed(lambda: deque(prepared.traverse(operation), maxlen=0), options.gc), len(keys)
+
+
+def count_work(engine_class, operation, keys, queries, options):
+    # Отдельный проход под счетчиками: обертки замедляют операции, поэтому время меряется без них.
+    stats = OperationStats()
+    with counting(stats):
+        keys = stats.wrap(keys)
+        queries = stats.wrap(queries)
+        engine = engine_class() if operation == 'insert' else build(engine_class, keys, options.bulk_load)
+        stats.reset()
+
+        if operation == 'insert':
+            for key in keys:
+                engine.insert(key)
+            ops = len(keys)
+        elif operation == 'delete':
+            for key in queries:
+                engine.delete(key)
+            ops = len(queries)
+        elif operation == 'find':
+            for key in queries:
+                engine.find(key)
+            ops = len(queries)
+        else:
+            deque(engine.traverse(operation), maxlen=0)
+            ops = len(keys)
+
+    counts = stats.snapshot()
+    return {f"{name}_per_op": counts[name] / ops for name in COUNTERS}
+
+
+def measure(engine_class, operation, size, options, rng):
+    keys = make_keys(size, options.distribution, rng)
+    queries = keys[:]
+    rng.shuffle(queries)
+
+    prepared = None
+    if operation == 'find' or operation in TRAVERSALS:
+        prepared = build(engine_class, keys, options.bulk_load)
+    # Высота дерева на этих ключах; у движков без height() - None
+    shape = prepared if prepared is not None else build(engine_class, keys, options.bulk_load)
+    height = shape.height() if hasattr(shape, 'height') else None
+
+    for _ in range(options.warmup):
+        run_once(engine_class, operation, keys, queries, prepared, options)
+
+    samples = []
+    ops = 0
+    for _ in range(options.repeat):
+        elapsed, ops = run_once(engine_class, operation, keys, queries, prepared, options)
+        samples.append(elapsed)
+
+    median = percentile(samples, 0.5)
+    row = {
+        'engine': engine_class.name,
+        'operation': operation,
+        'size': size,
+        'distribution': options.distribution,
+        'repeats': options.repeat,
+        'ops': ops,
+        'height': height,
+        'median_ns': median / ops,
+        'p95_ns': percentile(samples, 0.95) / ops,
+        'min_ns': min(samples) / ops,
+        'throughput': ops * 1e9 / median,
+    }
+    if options.stats:
+        if getattr(engine_class, 'stats', True):
+            row.update(count_work(engine_class, operation, keys, queries, options))
+        else:
+            row.update({f"{name}_per_op": None for name in COUNTERS})
+    return row
+
+
+def write_json(path, results):
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(results, file, ensure_ascii=False, indent=2)
+
+
+def write_csv(path, results):
+    with open(path, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.DictWriter(file, fieldnames=list(results[0]))
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def plot(path, results):
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    operations = list(dict.fromkeys(row['operation'] for row in results))
+    figure, axes = plt.subplots(len(operations), 1, figsize=(10, 4 * len(operations)), squeeze=False)
+
+    for axis, operation in zip(axes[:, 0], operations):
+        rows = [row for row in results if row['operation'] == operation]
+        for engine in dict.fromkeys(row['engine'] for row in rows):
+            points = [(row['size'], row['median_ns']) for row in rows if row['engine'] == engine]
+            axis.plot(*zip(*points), marker='o', label=engine)
+        axis.set_title(operation)
+        axis.set_xscale('log')
+        axis.set_xlabel('Размер дерева')
+        axis.set_ylabel('нс на операцию (медиана)')
+        axis.grid(True)
+        axis.legend()
+
+    figure.tight_layout()
+    figure.savefig(path)
+    plt.close(figure)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Замеры операций и обходов деревьев поиска")
+    parser.add_argument('--engines', nargs='+', choices=list(ENGINES), default=['bst', 'avl', 'rb', 'btree'])
+    parser.add_argument('--ops', nargs='+', choices=OPERATIONS, default=list(OPERATIONS))
+    parser.add_argument('--sizes', nargs='+', type=int, default=[1000, 10000, 100000])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--distribution', choices=DISTRIBUTIONS, default='random')
+    parser.add_argument('--bulk-load', action='store_true', help="строить дерево через from_iterable")
+    parser.add_argument('--gc', action='store_true', help="не отключать сборщик мусора во время замера")
+    parser.add_argument('--stats', action='store_true', help="посчитать сравнения, повороты, перекраски и т. п. на операцию")
+    parser.add_argument('--fanout', type=int, default=BTreeEngine.fanout, help="число детей узла B-дерева")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json')
+    parser.add_argument('--csv')
+    parser.add_argument('--plot')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    options = parse_args(argv)
+    BTreeEngine.fanout = options.fanout
+    rng = random.Random(options.seed)
+    results = []
+
+    for name in options.engines:
+        engine_class = ENGINES[name]
+        for operation in options.ops:
+            if operation not in engine_class.operations:
+                continue
+            for size in options.sizes:
+                row = measure(engine_class, operation, size, options, rng)
+                results.append(row)
+                height = row['height'] if row['height'] is not None else '-'
+                print(f"{row['engine']:<9} {row['operation']:<11} n={row['size']:<8} h={height:<4} "
+                      f"медиана {row['median_ns']:9.1f} нс, p95 {row['p95_ns']:9.1f} нс, "
+                      f"{row['throughput']:12.0f} оп/с")
+                if options.stats and not getattr(engine_class, 'stats', True):
+                    print(f"{'':<9} счетчики для этого движка недоступны")
+                elif options.stats:
+                    counters = ", ".join(f"{name} {row[f'{name}_per_op']:.2f}" for name in COUNTERS
+                                         if row[f'{name}_per_op'])
+                    print(f"{'':<9} на операцию: {counters or 'нет счетчиков'}")
+
+    if options.json:
+        write_json(options.json, results)
+    if options.csv and results:
+        write_csv(options.csv, results)
+    if options.plot and results:
+        plot(options.plot, results)
+
+    return results
+
+
+if __name__ == "__main__":
+    main()
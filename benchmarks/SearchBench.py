@@ -0,0 +1,70 @@
+import random
+
+from benchmarks.Lookups import make_queries, time_lookups
+from trees.Bst import BinarySearchTree
+from trees.RbTree import RedBlackTree
+from trees.avlTree import AVLTree
+
+SIZES = [1000, 10000, 100000]
+LOOKUPS = 100
+MISS_RATIO = 0.2
+
+
+def bst_searches(keys):
+    tree = BinarySearchTree()
+    root = None
+    for key in keys:
+        root = tree.insert(root, key)
+
+    return {
+        'find': lambda key: tree.find(root, key),
+        'Pre-order': lambda key: key in tree.iter_pre_order(root),
+        'In-order': lambda key: key in tree.iter_in_order(root),
+        'Post-order': lambda key: key in tree.iter_post_order(root),
+        'BFS': lambda key: key in tree.iter_bfs(root),
+    }
+
+
+def avl_searches(keys):
+    root = None
+    for key in keys:
+        root = AVLTree.insert(root, key)
+
+    return {
+        'find': lambda key: AVLTree.find(root, key),
+        'Pre-order': lambda key: key in AVLTree.iter_pre_order(root),
+        'In-order': lambda key: key in AVLTree.iter_in_order(root),
+        'Post-order': lambda key: key in AVLTree.iter_post_order(root),
+        'BFS': lambda key: key in AVLTree.iter_bfs(root),
+    }
+
+
+def rb_searches(keys):
+    tree = RedBlackTree()
+    for key in keys:
+        tree.insert(key)
+
+    return {
+        'find': tree.find,
+        'Pre-order': lambda key: key in tree.iter_pre_order(tree.root),
+        'In-order': lambda key: key in tree.iter_in_order(tree.root),
+        'Post-order': lambda key: key in tree.iter_post_order(tree.root),
+        'BFS': lambda key: key in tree.iter_bfs(tree.root),
+    }
+
+
+def main():
+    for size in SIZES:
+        keys = random.sample(range(1, size + 1), size)
+        queries = make_queries(keys, LOOKUPS, MISS_RATIO)
+        print(f"{size} ключей, {LOOKUPS} запросов, промахов {MISS_RATIO:.0%}:")
+
+        for name, build in (("BST", bst_searches), ("AVL", avl_searches), ("RB", rb_searches)):
+            searches = build(keys)
+            latencies = ", ".join(f"{label} {time_lookups(search, queries) * 1e6:.1f}"
+                                  for label, search in searches.items())
+            print(f"  {name:<4} мкс на поиск: {latencies}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import random
+import time
+
+from trees.RbTree import RedBlackTree
+from trees.avlTree import AVLTree
+
+LARGE = 100000
+CASES = [("перекос", 1000), ("перекос", 10000), ("равные", LARGE)]
+OPERATIONS = ('union', 'intersection', 'difference', 'symmetric_difference')
+
+
+def naive_union_avl(a, b):
+    for key in AVLTree.iter_in_order(b):
+        if not AVLTree.find(a, key):
+            a = AVLTree.insert(a, key)
+    return a
+
+
+def naive_union_rb(a, b):
+    for key in b.iter_in_order(b.root):
+        if a.find(key) == a.NIL_LEAF:
+            a.insert(key)
+    return a
+
+
+def elapsed(action):
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+def main():
+    large_keys = random.sample(range(LARGE * 10), LARGE)
+
+    for title, small_size in CASES:
+        small_keys = random.sample(range(LARGE * 10), small_size)
+        print(f"{title}: {LARGE} и {small_size} ключей, мс")
+
+        for name, make, run, naive in (
+                ("AVL", AVLTree.from_iterable, lambda op, a, b: getattr(AVLTree, op)(a, b), naive_union_avl),
+                ("RB", RedBlackTree.from_iterable, lambda op, a, b: getattr(RedBlackTree, op)(a, b), naive_union_rb)):
+            times = []
+            for operation in OPERATIONS:
+                a, b = make(large_keys), make(small_keys)
+                times.append(elapsed(lambda: run(operation, a, b)))
+            a, b = make(large_keys), make(small_keys)
+            naive_time = elapsed(lambda: naive(a, b))
+
+            row = ", ".join(f"{operation} {t * 1e3:7.1f}" for operation, t in zip(OPERATIONS, times))
+            print(f"  {name:<4} {row}; find+insert по одному {naive_time * 1e3:7.1f}")
+
+
+if __name__ == "__main__":
+    main()
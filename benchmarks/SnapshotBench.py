@@ -0,0 +1,67 @@
+import os
+import random
+import tempfile
+import time
+
+from trees.Bst import BinarySearchTree
+from trees.RbTree import RedBlackTree
+from trees.avlTree import AVLTree
+
+SIZE = 1000000
+INSERT_SAMPLE = 100000
+
+
+def elapsed(action):
+    start = time.perf_counter()
+    result = action()
+    return time.perf_counter() - start, result
+
+
+def insert_avl(keys):
+    root = None
+    for key in keys:
+        root = AVLTree.insert(root, key)
+
+
+def insert_rb(keys):
+    tree = RedBlackTree()
+    for key in keys:
+        tree.insert(key)
+
+
+def insert_bst(keys):
+    tree = BinarySearchTree()
+    root = None
+    for key in keys:
+        root = tree.insert(root, key)
+
+
+def main():
+    keys = random.sample(range(SIZE * 10), SIZE)
+    bst = BinarySearchTree()
+
+    rows = [
+        ("BST", lambda: BinarySearchTree.from_iterable(keys), lambda root, path: bst.save(root, path),
+         BinarySearchTree.load, insert_bst),
+        ("AVL", lambda: AVLTree.from_iterable(keys), AVLTree.save, AVLTree.load, insert_avl),
+        ("RB", lambda: RedBlackTree.from_iterable(keys), lambda tree, path: tree.save(path),
+         RedBlackTree.load, insert_rb),
+    ]
+
+    print(f"Снимок дерева из {SIZE} ключей:")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'tree.snapshot')
+        for name, build, save, load, insert in rows:
+            tree = build()
+            save_time, _ = elapsed(lambda: save(tree, path))
+            size = os.path.getsize(path)
+            del tree
+            load_time, _ = elapsed(lambda: load(path))
+            insert_time, _ = elapsed(lambda: insert(keys[:INSERT_SAMPLE]))
+            print(f"  {name:<4} файл {size / 2 ** 20:5.1f} МБ ({size / SIZE:4.1f} байт на ключ), "
+                  f"save {save_time:5.2f} с, load {load_time:5.2f} с, "
+                  f"insert по одному ~{insert_time * SIZE / INSERT_SAMPLE:5.1f} с")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import random
+import time
+from collections import deque
+
+from trees.ThreadedAvlTree import ThreadedAVLTree
+from trees.avlTree import AVLTree
+
+SIZE = 100000
+RANGES = 2000
+RANGE_WIDTH = 500
+
+
+def elapsed(action):
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+def inserts(tree, keys):
+    def action():
+        root = None
+        for key in keys:
+            root = tree.insert(root, key)
+    return action
+
+
+def deletes(tree, keys):
+    root = tree.from_iterable(keys)
+
+    def action():
+        nonlocal root
+        for key in keys:
+            root = tree.delete(root, key)
+    return action
+
+
+def scan(tree, root):
+    return lambda: deque(tree.iter_in_order(root), maxlen=0)
+
+
+def ranges(tree, root, lows):
+    def action():
+        for low in lows:
+            deque(tree.range(root, low, low + RANGE_WIDTH), maxlen=0)
+    return action
+
+
+def main():
+    keys = random.sample(range(SIZE * 10), SIZE)
+    lows = [random.randrange(SIZE * 10) for _ in range(RANGES)]
+    roots = {tree: tree.from_iterable(keys) for tree in (AVLTree, ThreadedAVLTree)}
+
+    print(f"{SIZE} ключей, AVL со стеком обхода против прошитого AVL:")
+    for name, make in (
+            ("вставка", lambda tree: inserts(tree, keys)),
+            ("удаление", lambda tree: deletes(tree, keys)),
+            ("полный обход", lambda tree: scan(tree, roots[tree])),
+            (f"{RANGES} диапазонов", lambda tree: ranges(tree, roots[tree], lows))):
+        plain = elapsed(make(AVLTree))
+        threaded = elapsed(make(ThreadedAVLTree))
+        print(f"  {name:<18} AVL {plain:.3f} с, прошитое {threaded:.3f} с, x{plain / threaded:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,19 @@
+import os
 import random
+import sys
 import time
-from collections import deque
 import matplotlib.pyplot as plt
 import numpy as np
 
+if __package__ in (None, ""):
+    # Запуск файлом (python orders/AvlTreeOrders.py): пакет trees ищется от корня репозитория
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trees import Traversal
+
 class TreeNode:
+    __slots__ = ('key', 'left', 'right', 'height')
+
     def __init__(self, key):
         self.key = key
         self.left = None
@@ -76,62 +85,37 @@ class AVLTree:
 
         return node
 
+    @staticmethod
+    def iter_pre_order(node):
+        return Traversal.pre_order(node)
+
+    @staticmethod
+    def iter_in_order(node):
+        return Traversal.in_order(node)
+
+    @staticmethod
+    def iter_post_order(node):
+        return Traversal.post_order(node)
+
+    @staticmethod
+    def iter_bfs(root):
+        return Traversal.level_order(root)
+
     @staticmethod
     def dfs_pre_order(node):
-         result = []
-         
-         def traverse(n):
-             if n:
-                 result.append(n.key)
-                 traverse(n.left)
-                 traverse(n.right)
-         
-         traverse(node)
-         return result
+        return list(AVLTree.iter_pre_order(node))
 
     @staticmethod
     def dfs_in_order(node):
-         result = []
-         def traverse(n):
-             if n:
-                 traverse(n.left)
-                 result.append(n.key)
-                 traverse(n.right)
-         
-         traverse(node)
-         return result
+        return list(AVLTree.iter_in_order(node))
 
     @staticmethod
     def dfs_post_order(node):
-         result = []
-         
-         def traverse(n):
-             if n:
-                 traverse(n.left)
-                 traverse(n.right)
-                 result.append(n.key)
-         traverse(node)
-         return result
+        return list(AVLTree.iter_post_order(node))
 
     @staticmethod
     def bfs_traversal(root):
-         result = []
-         
-         if not root:
-             return result
-
-         queue = deque([root])
-         
-         while queue:
-             current = queue.popleft()
-             result.append(current.key)  
-             
-             if current.left:
-                 queue.append(current.left)
-             if current.right:
-                 queue.append(current.right)
-         
-         return result
+        return list(AVLTree.iter_bfs(root))
 
 class AVLTreeApp:
      def __init__(self):
@@ -1,10 +1,19 @@
+import os
 import random
-import time
-from collections import deque
+import sys
 import matplotlib.pyplot as plt
 import numpy as np
 
+if __package__ in (None, ""):
+    # Запуск файлом (python orders/AvlTreeSearchOrder.py): benchmarks и trees ищутся от корня репозитория
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.Lookups import make_queries, time_lookups
+from trees import Traversal
+
 class TreeNode:
+    __slots__ = ('key', 'left', 'right', 'height')
+
     def __init__(self, key):
         self.key = key
         self.left = None
@@ -78,68 +87,53 @@ class AVLTree:
 
         return node
 
+    @staticmethod
+    def find(node, key):
+        while node and node.key != key:
+            node = node.left if key < node.key else node.right
+
+        return node
+
+    @staticmethod
+    def iter_pre_order(node):
+        return Traversal.pre_order(node)
+
+    @staticmethod
+    def iter_in_order(node):
+        return Traversal.in_order(node)
+
+    @staticmethod
+    def iter_post_order(node):
+        return Traversal.post_order(node)
+
+    @staticmethod
+    def iter_bfs(root):
+        return Traversal.level_order(root)
+
     @staticmethod
     def dfs_pre_order(node):
-         result = []
-         
-         def traverse(n):
-             if n:
-                 result.append(n.key)
-                 traverse(n.left)
-                 traverse(n.right)
-         
-         traverse(node)
-         return result
+        return list(AVLTree.iter_pre_order(node))
 
     @staticmethod
     def dfs_in_order(node):
-         result = []
-         
-         def traverse(n):
-             if n:
-                 traverse(n.left)
-                 result.append(n.key)
-                 traverse(n.right)
-         
-         traverse(node)
-         return result
+        return list(AVLTree.iter_in_order(node))
 
     @staticmethod
     def dfs_post_order(node):
-         result = []
-         
-         def traverse(n):
-             if n:
-                 traverse(n.left)
-                 traverse(n.right)
-                 result.append(n.key)
-         
-         traverse(node)
-         return result
+        return list(AVLTree.iter_post_order(node))
 
     @staticmethod
     def bfs_traversal(root):
-         result = []
-         
-         if not root:
-             return result
-
-         queue = deque([root])
-         
-         while queue:
-             current = queue.popleft()
-             result.append(current.key)  
-             
-             if current.left:
-                 queue.append(current.left)
-             if current.right:
-                 queue.append(current.right)
-         
-         return result
+        return list(AVLTree.iter_bfs(root))
+
+LOOKUPS = 200
+MISS_RATIO = 0.2
 
 class AVLTreeApp:
-     def __init__(self):
+     def __init__(self, lookups=LOOKUPS, miss_ratio=MISS_RATIO):
           self.root = None
+          self.lookups = lookups
+          self.miss_ratio = miss_ratio
         
      def measure_search_time(self, size):
           values_to_insert = random.sample(range(1, size + 1), size)
@@ -147,58 +141,43 @@ class AVLTreeApp:
           for value in values_to_insert:
               self.root = AVLTree.insert(self.root, value)
 
-          search_key = random.choice(values_to_insert)
-
-          times = {}
-
-          start_time_pre_order = time.time()
-          found_node_pre_order = AVLTree.dfs_pre_order(self.root)  
-          times['Pre-order'] = time.time() - start_time_pre_order
+          queries = make_queries(values_to_insert, self.lookups, self.miss_ratio)
+          root = self.root
 
-          start_time_in_order = time.time()
-          found_node_in_order = AVLTree.dfs_in_order(self.root)  
-          times['In-order'] = time.time() - start_time_in_order
+          searches = {
+              'find': lambda key: AVLTree.find(root, key),
+              'Pre-order': lambda key: key in AVLTree.iter_pre_order(root),
+              'In-order': lambda key: key in AVLTree.iter_in_order(root),
+              'Post-order': lambda key: key in AVLTree.iter_post_order(root),
+              'BFS': lambda key: key in AVLTree.iter_bfs(root),
+          }
 
-          start_time_post_order = time.time()
-          found_node_post_order = AVLTree.dfs_post_order(self.root)  
-          times['Post-order'] = time.time() - start_time_post_order
-
-          start_time_bfs = time.time()
-          found_node_bfs = AVLTree.bfs_traversal(self.root)  
-          times['BFS'] = time.time() - start_time_bfs
-
-          return times
+          return {label: time_lookups(search, queries) for label, search in searches.items()}
 
      def run(self):
           sizes = [1000, 5000, 10000, 20000, 50000]  
           
-          results_preorder, results_inorder, results_postorder, results_bfs= [], [], [], []
+          results = {size: self.measure_search_time(size) for size in sizes}
+          labels = ['find', 'Pre-order', 'In-order', 'Post-order', 'BFS']
 
           for size in sizes:
-              search_times = self.measure_search_time(size)
-              results_preorder.append(search_times['Pre-order'])
-              results_inorder.append(search_times['In-order'])
-              results_postorder.append(search_times['Post-order'])
-              results_bfs.append(search_times['BFS'])
+              latencies = ", ".join(f"{label} {results[size][label] * 1e6:.1f} мкс" for label in labels)
+              print(f"{size}: {latencies}")
 
           plt.figure(figsize=(14, 8))
 
-          for times, label in zip(
-              [results_preorder, results_inorder, results_postorder, results_bfs],
-              ['Pre-order', 'In-order', 'Post-order', 'BFS']):
-              
+          for label in labels:
+              times = [results[size][label] for size in sizes]
+              plt.plot(sizes, times, marker='o', label=label)
+
               log_sizes = np.log(sizes)  
               coeffs = np.polyfit(log_sizes[1:], times[1:], deg=1)  
-              regression_line_x_values = np.linspace(min(sizes), max(sizes), num=100) 
-              regression_line_y_values = np.exp(coeffs[0] * np.log(regression_line_x_values) + coeffs[1])  
-
-              plt.plot(regression_line_x_values, regression_line_y_values, linestyle='--', label=f'{label} Regression')
-
-              print(f"{label} Regression: y ≈ {coeffs[0]:.6f} * ln(x) + {coeffs[1]:.6f}")
+              print(f"{label} Regression: y ≈ {coeffs[0]:.9f} * ln(x) + {coeffs[1]:.9f}")
 
-          plt.title('Логарифмическая регрессия времени выполнения поиска по методам обхода')
+          plt.title(f'Время одного поиска: find и обходы с ранним выходом ({self.lookups} запросов, промахов {self.miss_ratio:.0%})')
           plt.xlabel('Размер дерева')
-          plt.ylabel('Время (секунды)')
+          plt.ylabel('Время на поиск (секунды)')
+          plt.yscale('log')
           plt.legend()
           plt.grid(True)
 
@@ -207,4 +186,4 @@ class AVLTreeApp:
 
 if __name__ == "__main__":
      app = AVLTreeApp()
-     app.run()
\ No newline at end of file
+     app.run()
@@ -1,10 +1,19 @@
+import os
 import random
+import sys
 import time
-from collections import deque
 import matplotlib.pyplot as plt
 import numpy as np
 
+if __package__ in (None, ""):
+    # Запуск файлом (python orders/BstOrdersOutDemo.py): пакет trees ищется от корня репозитория
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trees import Traversal
+
 class TreeNode:
+    __slots__ = ('key', 'left', 'right')
+
     def __init__(self, key):
         self.key = key
         self.left = None
@@ -32,60 +41,29 @@ class BinaryTree:
             else:
                 self._insert_recursively(node.right, key)
 
+    def iter_pre_order(self, node):
+        return Traversal.pre_order(node)
+
+    def iter_in_order(self, node):
+        return Traversal.in_order(node)
+
+    def iter_post_order(self, node):
+        return Traversal.post_order(node)
+
+    def iter_bfs(self, root):
+        return Traversal.level_order(root)
+
     def dfs_pre_order(self, node):
-         result = []
-         
-         def traverse(n):
-             if n:
-                 result.append(n.key)
-                 traverse(n.left)
-                 traverse(n.right)
-         
-         traverse(node)
-         return result
+        return list(self.iter_pre_order(node))
 
     def dfs_in_order(self, node):
-         result = []
-         
-         def traverse(n):
-             if n:
-                 traverse(n.left)
-                 result.append(n.key)
-                 traverse(n.right)
-         
-         traverse(node)
-         return result
+        return list(self.iter_in_order(node))
 
     def dfs_post_order(self, node):
-         result = []
-         
-         def traverse(n):
-             if n:
-                 traverse(n.left)
-                 traverse(n.right)
-                 result.append(n.key)
-         
-         traverse(node)
-         return result
+        return list(self.iter_post_order(node))
 
     def bfs_traversal(self, root):
-         result = []
-         
-         if not root:
-             return result
-
-         queue = deque([root])
-         
-         while queue:
-             current = queue.popleft()
-             result.append(current.key)  
-             
-             if current.left:
-                 queue.append(current.left)
-             if current.right:
-                 queue.append(current.right)
-         
-         return result
+        return list(self.iter_bfs(root))
 
 class BinaryTreeApp:
      def __init__(self):
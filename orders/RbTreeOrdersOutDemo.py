@@ -1,13 +1,25 @@
+import os
 import random
+import sys
 import time
-from collections import deque
 import matplotlib.pyplot as plt
 import numpy as np
 
+if __package__ in (None, ""):
+    # Запуск файлом (python orders/RbTreeOrdersOutDemo.py): пакет trees ищется от корня репозитория
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trees import Traversal
+
+RED = True
+BLACK = False
+
 class TreeNode:
+    __slots__ = ('key', 'color', 'left', 'right', 'parent')
+
     def __init__(self, key):
         self.key = key
-        self.color = 'red' 
+        self.color = RED 
         self.left = None
         self.right = None
         self.parent = None
@@ -15,7 +27,7 @@ class TreeNode:
 class RedBlackTree:
     def __init__(self):
         self.NIL_LEAF = TreeNode(None)  
-        self.NIL_LEAF.color = 'black'  
+        self.NIL_LEAF.color = BLACK  
         self.root = self.NIL_LEAF
 
     def insert(self, key):
@@ -40,41 +52,41 @@ class RedBlackTree:
         else:
             parent.right = new_node
         
-        new_node.color = 'red'  
+        new_node.color = RED  
         self.fix_insert(new_node)
 
     def fix_insert(self, node):
-        while node != self.root and node.parent.color == 'red':
+        while node != self.root and node.parent.color == RED:
             if node.parent == node.parent.parent.left:  
                 uncle = node.parent.parent.right
-                if uncle.color == 'red':  
-                    node.parent.color = 'black'
-                    uncle.color = 'black'
-                    node.parent.parent.color = 'red'
+                if uncle.color == RED:  
+                    node.parent.color = BLACK
+                    uncle.color = BLACK
+                    node.parent.parent.color = RED
                     node = node.parent.parent
                 else:  
                     if node == node.parent.right:  
                         node = node.parent
                         self.left_rotate(node)  
-                    node.parent.color = 'black'
-                    node.parent.parent.color = 'red'
+                    node.parent.color = BLACK
+                    node.parent.parent.color = RED
                     self.right_rotate(node.parent.parent)
             else:  
                 uncle = node.parent.parent.left
-                if uncle.color == 'red':
-                    node.parent.color = 'black'
-                    uncle.color = 'black'
-                    node.parent.parent.color = 'red'
+                if uncle.color == RED:
+                    node.parent.color = BLACK
+                    uncle.color = BLACK
+                    node.parent.parent.color = RED
                     node = node.parent.parent
                 else:
                     if node == node.parent.left:
                         node = node.parent
                         self.right_rotate(node)
-                    node.parent.color = 'black'
-                    node.parent.parent.color = 'red'
+                    node.parent.color = BLACK
+                    node.parent.parent.color = RED
                     self.left_rotate(node.parent.parent)
         
-        self.root.color = 'black'
+        self.root.color = BLACK
 
     def left_rotate(self, x):
         y = x.right
@@ -110,60 +122,29 @@ class RedBlackTree:
         x.right = y
         y.parent = x
 
+    def iter_pre_order(self, node):
+        return Traversal.pre_order(node, self.NIL_LEAF)
+
+    def iter_in_order(self, node):
+        return Traversal.in_order(node, self.NIL_LEAF)
+
+    def iter_post_order(self, node):
+        return Traversal.post_order(node, self.NIL_LEAF)
+
+    def iter_bfs(self, root):
+        return Traversal.level_order(root, self.NIL_LEAF)
+
     def dfs_pre_order(self, node):
-         result = []
-         
-         def traverse(n):
-             if n != self.NIL_LEAF:
-                 result.append(n.key)
-                 traverse(n.left)
-                 traverse(n.right)
-         
-         traverse(node)
-         return result
+        return list(self.iter_pre_order(node))
 
     def dfs_in_order(self, node):
-         result = []
-         
-         def traverse(n):
-             if n != self.NIL_LEAF:
-                 traverse(n.left)
-                 result.append(n.key)
-                 traverse(n.right)
-         
-         traverse(node)
-         return result
+        return list(self.iter_in_order(node))
 
     def dfs_post_order(self, node):
-         result = []
-         
-         def traverse(n):
-             if n != self.NIL_LEAF:
-                 traverse(n.left)
-                 traverse(n.right)
-                 result.append(n.key)
-         
-         traverse(node)
-         return result
+        return list(self.iter_post_order(node))
 
     def bfs_traversal(self, root):
-         result = []
-         
-         if not root or root == self.NIL_LEAF:
-             return result
-
-         queue = deque([root])
-         
-         while queue:
-             current = queue.popleft()
-             result.append(current.key)  
-             
-             if current.left != self.NIL_LEAF:
-                 queue.append(current.left)
-             if current.right != self.NIL_LEAF:
-                 queue.append(current.right)
-         
-         return result
+        return list(self.iter_bfs(root))
 
 class RedBlackTreeApp:
      def __init__(self):
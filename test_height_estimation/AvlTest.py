@@ -3,6 +3,8 @@ import numpy as np
 import random
 
 class TreeNode:
+    __slots__ = ('key', 'left', 'right', 'height')
+
     def __init__(self, key):
         self.key = key
         self.left = None
@@ -3,69 +3,114 @@ import matplotlib.pyplot as plt
 import numpy as np
 
 class TreeNode:
+    __slots__ = ('key', 'left', 'right')
+
     def __init__(self, key):
         self.key = key
         self.left = None
         self.right = None
 
 class BinarySearchTree:
-    def insert(self, node, key):
+    def __init__(self):
+        # Максимальная глубина известна для корня depth_root, пока не выставлен dirty.
+        self.depth_root = None
+        self.max_depth = 0
+        self.dirty = False
 
+    def insert(self, node, key):
+        new_node = TreeNode(key)
         if node is None:
-            return TreeNode(key)
+            self.depth_root = new_node
+            self.max_depth = 1
+            self.dirty = False
+            return new_node
 
-        if key < node.key:
-            node.left = self.insert(node.left, key)
-        else:
-            node.right = self.insert(node.right, key)
+        current = node
+        depth = 2
+        while True:
+            if key < current.key:
+                if current.left is None:
+                    current.left = new_node
+                    break
+                current = current.left
+            else:
+                if current.right is None:
+                    current.right = new_node
+                    break
+                current = current.right
+            depth += 1
+
+        if node is not self.depth_root:
+            self.depth_root = node
+            self.dirty = True
+        elif depth > self.max_depth:
+            self.max_depth = depth
 
         return node
 
     def find(self, node, key):
+        while node is not None and node.key != key:
+            node = node.left if key < node.key else node.right
 
-        if node is None or node.key == key:
-            return node
-        
-        if key < node.key:
-            return self.find(node.left, key)
-        
-        return self.find(node.right)
+        return node
 
     def delete(self, root, key):
+        parent = None
+        node = root
+        while node is not None and node.key != key:
+            parent = node
+            node = node.left if key < node.key else node.right
 
-        if root is None:
+        if node is None:
             return root
 
-        if key < root.key:
-            root.left = self.delete(root.left, key)
-        elif key > root.key:
-            root.right = self.delete(root.right, key)
-        else: 
-            if root.left is None:
-                return root.right
-            elif root.right is None:
-                return root.left
-            temp = self.min_value_node(root.right)
-            root.key = temp.key
-            root.right = self.delete(root.right, temp.key)
+        self.dirty = True
+
+        if node.left is not None and node.right is not None:
+            parent = node
+            successor = node.right
+            while successor.left is not None:
+                parent = successor
+                successor = successor.left
+
+            node.key = successor.key
+            node = successor
+
+        child = node.left if node.left is not None else node.right
+
+        if parent is None:
+            self.depth_root = child
+            return child
+        if parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
 
         return root
 
     def min_value_node(self, node):
-
         current = node
         while current.left is not None:
             current = current.left
         return current
 
     def height(self, node):
+        if node is not self.depth_root or self.dirty:
+            self.depth_root = node
+            self.max_depth = self.measure_height(node)
+            self.dirty = False
 
-        if node is None:
-            return 0
-        else:
-            left_height = self.height(node.left)
-            right_height = self.height(node.right)
-            return max(left_height, right_height) + 1
+        return self.max_depth
+
+    def measure_height(self, node):
+        height = 0
+        level = [node] if node is not None else []
+
+        while level:
+            height += 1
+            level = [child for current in level for child in (current.left, current.right) if child is not None]
+
+        return height
 
 
 class BinarySearchTreeApp:
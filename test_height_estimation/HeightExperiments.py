@@ -0,0 +1,197 @@
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+if __package__ in (None, ""):
+    # Запуск файлом, без -m: пакет trees ищется от корня репозитория
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trees.BTree import BTree
+from trees.Bst import BinarySearchTree
+from trees.RbTree import RedBlackTree
+from trees.avlTree import AVLTree
+
+TREES = ('bst', 'avl', 'rb', 'btree')
+DISTRIBUTIONS = ('random', 'sorted', 'duplicates')
+# BST на отсортированных ключах вырождается в список: высота ровно n, а построение O(n^2).
+DEGENERATE = {('bst', 'sorted')}
+PERCENTILES = (5, 50, 95)
+
+
+def make_keys(size, distribution, rng):
+    if distribution == 'sorted':
+        return list(range(1, size + 1))
+    if distribution == 'duplicates':
+        return [rng.randint(1, max(1, size // 10)) for _ in range(size)]
+    return rng.sample(range(1, size * 10 + 1), size)
+
+
+def trial(tree, distribution, seed, max_n, step):
+    # Высоты дерева после каждых step вставок; ключи зависят только от распределения и seed.
+    keys = make_keys(max_n, distribution, random.Random(f"{distribution}-{seed}"))
+    heights = []
+
+    if tree == 'bst':
+        bst = BinarySearchTree()
+        root = None
+        for i, key in enumerate(keys, 1):
+            root = bst.insert(root, key)
+            if i % step == 0:
+                heights.append(bst.height(root))
+    elif tree == 'avl':
+        root = None
+        for i, key in enumerate(keys, 1):
+            root = AVLTree.insert(root, key)
+            if i % step == 0:
+                heights.append(AVLTree.get_height(root))
+    elif tree == 'btree':
+        # высота B-дерева - число уровней, повторные ключи не добавляются
+        btree = BTree()
+        for i, key in enumerate(keys, 1):
+            btree.insert(key)
+            if i % step == 0:
+                heights.append(btree.height())
+    else:
+        rb = RedBlackTree()
+        for i, key in enumerate(keys, 1):
+            rb.insert(key)
+            if i % step == 0:
+                heights.append(rb.height())
+
+    return tree, distribution, heights
+
+
+def fit_log2(sizes, heights):
+    # h = a*log2(n) + b по всем точкам всех прогонов, 95% интервалы по нормальному приближению
+    x = np.log2(np.repeat(sizes[np.newaxis, :], heights.shape[0], axis=0).ravel())
+    y = heights.ravel().astype(np.float64)
+    if len(np.unique(y)) == 1 or x.size < 4:
+        coefficients = np.polyfit(x, y, 1)
+        return coefficients, np.zeros(2)
+
+    coefficients, covariance = np.polyfit(x, y, 1, cov=True)
+    return coefficients, 1.96 * np.sqrt(np.diag(covariance))
+
+
+def aggregate(results, sizes):
+    summary = {}
+    for (tree, distribution), runs in results.items():
+        heights = np.array(runs)
+        (a, b), (a_error, b_error) = fit_log2(sizes, heights)
+        summary[(tree, distribution)] = {
+            'tree': tree,
+            'distribution': distribution,
+            'trials': len(runs),
+            'n': sizes.tolist(),
+            'mean': heights.mean(axis=0).tolist(),
+            'min': heights.min(axis=0).tolist(),
+            'max': heights.max(axis=0).tolist(),
+            **{f"p{p}": np.percentile(heights, p, axis=0).tolist() for p in PERCENTILES},
+            'a': float(a), 'a_ci': float(a_error),
+            'b': float(b), 'b_ci': float(b_error),
+        }
+    return summary
+
+
+def run_trials(tasks, workers):
+    results = {}
+    if workers == 1:
+        outputs = (trial(*task) for task in tasks)
+        for tree, distribution, heights in outputs:
+            results.setdefault((tree, distribution), []).append(heights)
+        return results
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(trial, *task) for task in tasks]
+        for future in futures:
+            tree, distribution, heights = future.result()
+            results.setdefault((tree, distribution), []).append(heights)
+    return results
+
+
+def plot(path, summary):
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    figure, axis = plt.subplots(figsize=(10, 6))
+    for row in summary.values():
+        label = f"{row['tree']}/{row['distribution']}"
+        line, = axis.plot(row['n'], row['mean'], 'o', label=label)
+        axis.fill_between(row['n'], row['min'], row['max'], color=line.get_color(), alpha=0.2)
+        fit = row['a'] * np.log2(row['n']) + row['b']
+        axis.plot(row['n'], fit, color=line.get_color(), linestyle='--')
+
+    axis.set_title("Высота деревьев поиска: среднее, разброс min-max и регрессия a*log2(n)+b")
+    axis.set_xlabel("Количество ключей(n)")
+    axis.set_ylabel("Высота дерева(h)")
+    axis.grid(True)
+    axis.legend()
+    figure.tight_layout()
+    figure.savefig(path)
+    plt.close(figure)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Многократные замеры высоты деревьев в нескольких процессах")
+    parser.add_argument('--trees', nargs='+', choices=TREES, default=list(TREES))
+    parser.add_argument('--distributions', nargs='+', choices=DISTRIBUTIONS, default=['random', 'sorted'])
+    parser.add_argument('--trials', type=int, default=20)
+    parser.add_argument('--max-n', type=int, default=10000)
+    parser.add_argument('--step', type=int, default=500)
+    parser.add_argument('--workers', type=int, default=None, help="по умолчанию - число ядер")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--compare-serial', action='store_true', help="повторить прогон в одном процессе и сравнить время")
+    parser.add_argument('--json')
+    parser.add_argument('--plot')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    options = parse_args(argv)
+    tasks = []
+    for tree in options.trees:
+        for distribution in options.distributions:
+            if (tree, distribution) in DEGENERATE:
+                print(f"{tree}/{distribution} пропущено: высота равна n")
+                continue
+            for i in range(options.trials):
+                tasks.append((tree, distribution, options.seed + i, options.max_n, options.step))
+
+    sizes = np.arange(options.step, options.max_n + 1, options.step)
+
+    start = time.perf_counter()
+    results = run_trials(tasks, options.workers)
+    parallel_time = time.perf_counter() - start
+    summary = aggregate(results, sizes)
+
+    for row in summary.values():
+        print(f"{row['tree']:<4} {row['distribution']:<11} {row['trials']} прогонов, n={row['n'][-1]}: "
+              f"средняя {row['mean'][-1]:.1f}, min {row['min'][-1]}, max {row['max'][-1]}, "
+              f"p95 {row['p95'][-1]:.1f}; "
+              f"h ≈ ({row['a']:.3f} ± {row['a_ci']:.3f}) * log2(n) + ({row['b']:.3f} ± {row['b_ci']:.3f})")
+    print(f"Время: {parallel_time:.2f} с на {len(tasks)} прогонов")
+
+    if options.compare_serial:
+        start = time.perf_counter()
+        run_trials(tasks, 1)
+        serial_time = time.perf_counter() - start
+        print(f"В одном процессе: {serial_time:.2f} с, ускорение x{serial_time / parallel_time:.2f}")
+
+    if options.json:
+        with open(options.json, 'w', encoding='utf-8') as file:
+            json.dump(list(summary.values()), file, ensure_ascii=False, indent=2)
+    if options.plot and summary:
+        plot(options.plot, summary)
+
+    return summary
+
+
+if __name__ == "__main__":
+    main()
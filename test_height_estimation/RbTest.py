@@ -1,19 +1,27 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
+RED = True
+BLACK = False
+
 class TreeNode:
+    __slots__ = ('key', 'color', 'left', 'right', 'parent', 'height')
+
     def __init__(self, key):
         self.key = key
-        self.color = 'red'  
+        self.color = RED  
         self.left = None
         self.right = None
         self.parent = None
+        self.height = 1
 
 class RedBlackTree:
     def __init__(self):
         self.NIL_LEAF = TreeNode(None)  
-        self.NIL_LEAF.color = 'black'  
+        self.NIL_LEAF.color = BLACK  
+        self.NIL_LEAF.height = 0
         self.root = self.NIL_LEAF
+        self.bh = 0
 
     def insert(self, key):
         new_node = TreeNode(key)
@@ -37,41 +45,48 @@ class RedBlackTree:
         else:
             parent.right = new_node
         
-        new_node.color = 'red'  
+        new_node.color = RED  
         self.fix_insert(new_node)
 
+        node = new_node
+        while node is not None:
+            node.height = 1 + max(node.left.height, node.right.height)
+            node = node.parent
+
     def fix_insert(self, node):
-        while node != self.root and node.parent.color == 'red':
+        while node != self.root and node.parent.color == RED:
             if node.parent == node.parent.parent.left:  
                 uncle = node.parent.parent.right
-                if uncle.color == 'red':  
-                    node.parent.color = 'black'
-                    uncle.color = 'black'
-                    node.parent.parent.color = 'red'
+                if uncle.color == RED:  
+                    node.parent.color = BLACK
+                    uncle.color = BLACK
+                    node.parent.parent.color = RED
                     node = node.parent.parent
                 else:  
                     if node == node.parent.right:  
                         node = node.parent
                         self.left_rotate(node)  
-                    node.parent.color = 'black'
-                    node.parent.parent.color = 'red'
+                    node.parent.color = BLACK
+                    node.parent.parent.color = RED
                     self.right_rotate(node.parent.parent)
             else:  
                 uncle = node.parent.parent.left
-                if uncle.color == 'red':
-                    node.parent.color = 'black'
-                    uncle.color = 'black'
-                    node.parent.parent.color = 'red'
+                if uncle.color == RED:
+                    node.parent.color = BLACK
+                    uncle.color = BLACK
+                    node.parent.parent.color = RED
                     node = node.parent.parent
                 else:
                     if node == node.parent.left:
                         node = node.parent
                         self.right_rotate(node)
-                    node.parent.color = 'black'
-                    node.parent.parent.color = 'red'
+                    node.parent.color = BLACK
+                    node.parent.parent.color = RED
                     self.left_rotate(node.parent.parent)
         
-        self.root.color = 'black'
+        if self.root.color == RED:
+            self.bh += 1
+        self.root.color = BLACK
 
     def left_rotate(self, x):
         y = x.right
@@ -90,6 +105,9 @@ class RedBlackTree:
         y.left = x
         x.parent = y
 
+        x.height = 1 + max(x.left.height, x.right.height)
+        y.height = 1 + max(x.height, y.right.height)
+
     def right_rotate(self, y):
         x = y.left
         y.left = x.right
@@ -107,11 +125,15 @@ class RedBlackTree:
         x.right = y
         y.parent = x
 
+        y.height = 1 + max(y.left.height, y.right.height)
+        x.height = 1 + max(x.left.height, y.height)
+
     def height(self, node):
         """Возвращает высоту дерева."""
-        if node == self.NIL_LEAF:
-            return 0
-        return 1 + max(self.height(node.left), self.height(node.right))
+        return node.height
+
+    def black_height(self):
+        return self.bh
 
 class RedBlackTreeApp:
     def __init__(self):
@@ -0,0 +1,337 @@
+import random
+from array import array
+
+RED = 1
+BLACK = 0
+
+class RedBlackTree:
+    # Узлы - индексы в параллельных массивах, 0 - общий NIL-лист.
+    NIL_LEAF = 0
+
+    def __init__(self):
+        self.key = array('q', [0])
+        self.color = array('b', [BLACK])
+        self.left = array('i', [0])
+        self.right = array('i', [0])
+        self.parent = array('i', [0])
+        self.root = self.NIL_LEAF
+        self.free = self.NIL_LEAF
+        self.size = 0
+
+    def new_node(self, key):
+        node = self.free
+
+        if node != self.NIL_LEAF:
+            self.free = self.right[node]
+            self.key[node] = key
+            self.color[node] = RED
+            self.left[node] = self.NIL_LEAF
+            self.right[node] = self.NIL_LEAF
+            self.parent[node] = self.NIL_LEAF
+        else:
+            node = len(self.key)
+            self.key.append(key)
+            self.color.append(RED)
+            self.left.append(self.NIL_LEAF)
+            self.right.append(self.NIL_LEAF)
+            self.parent.append(self.NIL_LEAF)
+
+        self.size += 1
+        return node
+
+    def free_node(self, node):
+        # Освобождённые ячейки связаны в список через массив right.
+        self.right[node] = self.free
+        self.free = node
+        self.size -= 1
+
+    def insert(self, key):
+        keys, left, right = self.key, self.left, self.right
+        new_node = self.new_node(key)
+        parent = self.NIL_LEAF
+        current = self.root
+
+        while current != self.NIL_LEAF:
+            parent = current
+            if key < keys[current]:
+                current = left[current]
+            else:
+                current = right[current]
+
+        self.parent[new_node] = parent
+
+        if parent == self.NIL_LEAF:
+            self.root = new_node
+        elif key < keys[parent]:
+            left[parent] = new_node
+        else:
+            right[parent] = new_node
+
+        self.fix_insert(new_node)
+
+    def fix_insert(self, node):
+        color, left, right, parent = self.color, self.left, self.right, self.parent
+
+        while node != self.root and color[parent[node]] == RED:
+            father = parent[node]
+            grandfather = parent[father]
+
+            if father == left[grandfather]:
+                uncle = right[grandfather]
+                if color[uncle] == RED:
+                    color[father] = BLACK
+                    color[uncle] = BLACK
+                    color[grandfather] = RED
+                    node = grandfather
+                else:
+                    if node == right[father]:
+                        node = father
+                        self.left_rotate(node)
+                    color[parent[node]] = BLACK
+                    color[parent[parent[node]]] = RED
+                    self.right_rotate(parent[parent[node]])
+            else:
+                uncle = left[grandfather]
+                if color[uncle] == RED:
+                    color[father] = BLACK
+                    color[uncle] = BLACK
+                    color[grandfather] = RED
+                    node = grandfather
+                else:
+                    if node == left[father]:
+                        node = father
+                        self.right_rotate(node)
+                    color[parent[node]] = BLACK
+                    color[parent[parent[node]]] = RED
+                    self.left_rotate(parent[parent[node]])
+
+        color[self.root] = BLACK
+
+    def left_rotate(self, x):
+        left, right, parent = self.left, self.right, self.parent
+        y = right[x]
+        right[x] = left[y]
+
+        if left[y] != self.NIL_LEAF:
+            parent[left[y]] = x
+
+        parent[y] = parent[x]
+
+        if parent[x] == self.NIL_LEAF:
+            self.root = y
+        elif x == left[parent[x]]:
+            left[parent[x]] = y
+        else:
+            right[parent[x]] = y
+
+        left[y] = x
+        parent[x] = y
+
+    def right_rotate(self, y):
+        left, right, parent = self.left, self.right, self.parent
+        x = left[y]
+        left[y] = right[x]
+
+        if right[x] != self.NIL_LEAF:
+            parent[right[x]] = y
+
+        parent[x] = parent[y]
+
+        if parent[y] == self.NIL_LEAF:
+            self.root = x
+        elif y == right[parent[y]]:
+            right[parent[y]] = x
+        else:
+            left[parent[y]] = x
+
+        right[x] = y
+        parent[y] = x
+
+    def find(self, key):
+        keys, left, right = self.key, self.left, self.right
+        node = self.root
+
+        while node != self.NIL_LEAF and keys[node] != key:
+            node = left[node] if key < keys[node] else right[node]
+
+        return node
+
+    def delete(self, key):
+        # Возвращает, был ли ключ в дереве
+        z = self.find(key)
+
+        if z == self.NIL_LEAF:
+            return False
+
+        color, left, right, parent = self.color, self.left, self.right, self.parent
+        original_color_y = color[z]
+
+        if left[z] == self.NIL_LEAF:
+            x = right[z]
+            self.transplant(z, right[z])
+
+        elif right[z] == self.NIL_LEAF:
+            x = left[z]
+            self.transplant(z, left[z])
+
+        else:
+            y = self.min_value_node(right[z])
+            original_color_y = color[y]
+            x = right[y]
+
+            if parent[y] == z:
+                parent[x] = y
+
+            else:
+                self.transplant(y, right[y])
+                right[y] = right[z]
+                parent[right[y]] = y
+
+            self.transplant(z, y)
+            left[y] = left[z]
+            parent[left[y]] = y
+            color[y] = color[z]
+
+        self.free_node(z)
+
+        if original_color_y == BLACK:
+            self.fix_delete(x)
+        return True
+
+    def transplant(self, u, v):
+        left, right, parent = self.left, self.right, self.parent
+
+        if parent[u] == self.NIL_LEAF:
+            self.root = v
+
+        elif u == left[parent[u]]:
+            left[parent[u]] = v
+
+        else:
+            right[parent[u]] = v
+
+        parent[v] = parent[u]
+
+    def fix_delete(self, x):
+        color, left, right, parent = self.color, self.left, self.right, self.parent
+
+        while x != self.root and color[x] == BLACK:
+            if x == left[parent[x]]:
+                w = right[parent[x]]
+                if color[w] == RED:
+                    color[w] = BLACK
+                    color[parent[x]] = RED
+                    self.left_rotate(parent[x])
+                    w = right[parent[x]]
+                if color[left[w]] == BLACK and color[right[w]] == BLACK:
+                    color[w] = RED
+                    x = parent[x]
+                else:
+                    if color[right[w]] == BLACK:
+                        color[left[w]] = BLACK
+                        color[w] = RED
+                        self.right_rotate(w)
+                        w = right[parent[x]]
+                    color[w] = color[parent[x]]
+                    color[parent[x]] = BLACK
+                    color[right[w]] = BLACK
+                    self.left_rotate(parent[x])
+                    x = self.root
+
+            else:
+                w = left[parent[x]]
+                if color[w] == RED:
+                    color[w] = BLACK
+                    color[parent[x]] = RED
+                    self.right_rotate(parent[x])
+                    w = left[parent[x]]
+
+                if color[right[w]] == BLACK and color[left[w]] == BLACK:
+                    color[w] = RED
+                    x = parent[x]
+
+                else:
+                    if color[left[w]] == BLACK:
+                        color[right[w]] = BLACK
+                        color[w] = RED
+                        self.left_rotate(w)
+
+                        w = left[parent[x]]
+
+                    color[w] = color[parent[x]]
+                    color[parent[x]] = BLACK
+                    color[left[w]] = BLACK
+                    self.right_rotate(parent[x])
+
+                    x = self.root
+
+        color[x] = BLACK
+
+    def min_value_node(self, node):
+        left = self.left
+        while left[node] != self.NIL_LEAF:
+            node = left[node]
+
+        return node
+
+    def in_order_keys(self):
+        keys, left, right = self.key, self.left, self.right
+        result = array('q')
+        stack = []
+        node = self.root
+
+        while stack or node != self.NIL_LEAF:
+            while node != self.NIL_LEAF:
+                stack.append(node)
+                node = left[node]
+
+            node = stack.pop()
+            result.append(keys[node])
+            node = right[node]
+
+        return result
+
+    def print_tree(self, node, level=0, prefix="Root: "):
+        if node != self.NIL_LEAF:
+            color = 'red' if self.color[node] == RED else 'black'
+            print(" " * (level * 4) + prefix + str(self.key[node]) + f" ({color})")
+            if self.right[node] != self.NIL_LEAF:
+                self.print_tree(self.right[node], level + 1, prefix=" |- R: ")
+            if self.left[node] != self.NIL_LEAF:
+                self.print_tree(self.left[node], level + 1, prefix=" |- L: ")
+
+class RedBlackTreeApp:
+    def __init__(self):
+        self.tree = RedBlackTree()
+        for value in random.sample(range(1, 301), 300):
+            self.tree.insert(value)
+
+    def run(self):
+        while True:
+            action = input("Выберите действие:\n1. Вставить узел\n2. Удалить узел\n3. Найти узел\n4. Вывести дерево\n5. Выход\n")
+            if action == "1":
+                key = int(input("Введите значение для вставки: "))
+                print(f"Вставлено: {key}")
+                self.tree.insert(key)
+            elif action == "2":
+                key = int(input("Введите значение для удаления: "))
+                if self.tree.delete(key):
+                    print(f"Удалено: {key}")
+                else:
+                    print(f"Узел с ключом {key} не найден.")
+            elif action == "3":
+                key = int(input("Введите значение для поиска: "))
+                found_node = self.tree.find(key)
+                message = "Узел найден!" if found_node != self.tree.NIL_LEAF else "Узел не найден."
+                print(message)
+            elif action == "4":
+                print("Вывод дерева:")
+                self.tree.print_tree(self.tree.root)
+            elif action == "5":
+                break
+            else:
+                print("Пожалуйста, введите корректное действие.")
+
+if __name__ == "__main__":
+    app = RedBlackTreeApp()
+    app.run()
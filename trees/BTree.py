@@ -0,0 +1,308 @@
+import os
+import random
+import sys
+from bisect import bisect_left, bisect_right
+
+if __package__ in (None, ""):
+    # Запуск файлом (python trees/BTree.py): пакет trees ищется от корня репозитория
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trees import Stats, Traversal
+
+# B+-дерево: упорядоченное множество ключей. Ключи лежат только в листьях,
+# отсортированными списками, листья связаны в цепочку через next.
+# Внутренний узел хранит разделители: keys[i] - нижняя граница ключей в children[i + 1].
+# Поиск внутри узла - bisect, поэтому на уровень приходится один вызов на C,
+# а уровней при fanout 64 и миллионе ключей всего 4 вместо 20-40 у двоичных деревьев.
+# Повторная вставка существующего ключа ничего не меняет.
+
+class BTreeNode:
+    __slots__ = ('keys', 'children', 'next')
+
+    def __init__(self, keys, children=None):
+        self.keys = keys
+        # None у листа, список из len(keys) + 1 детей у внутреннего узла
+        self.children = children
+        self.next = None
+
+
+def chunks(count, fill, minimum):
+    # Границы раскладки count элементов по узлам примерно по fill, но не меньше minimum в каждом
+    groups = -(-count // fill)
+    while groups > 1 and count // groups < minimum:
+        groups -= 1
+    size, extra = divmod(count, groups)
+    low = 0
+    for i in range(groups):
+        high = low + size + (i < extra)
+        yield low, high
+        low = high
+
+
+class BTree:
+    def __init__(self, fanout=64):
+        if fanout < 4:
+            raise ValueError("fanout должен быть не меньше 4")
+        self.fanout = fanout
+        # Узел переполнен при fanout ключах (листья) или fanout + 1 детях, недозаполнен - меньше чем при половине.
+        self.max_keys = fanout - 1
+        self.min_keys = (fanout - 1) // 2
+        self.root = BTreeNode([])
+        self.size = 0
+
+    @classmethod
+    def from_sorted(cls, keys, fanout=64):
+        # Узлы заполняются примерно на три четверти: вставкам остается место без немедленных разбиений.
+        tree = cls(fanout)
+        keys = list(keys)
+        keys = [key for i, key in enumerate(keys) if i == 0 or key != keys[i - 1]]
+        if not keys:
+            return tree
+
+        fill = max(tree.min_keys, tree.max_keys * 3 // 4)
+        level = [BTreeNode(keys[low:high]) for low, high in chunks(len(keys), fill, tree.min_keys)]
+        for left, right in zip(level, level[1:]):
+            left.next = right
+        lows = [node.keys[0] for node in level]
+
+        while len(level) > 1:
+            parents = []
+            parent_lows = []
+            for low, high in chunks(len(level), fill + 1, tree.min_keys + 1):
+                parents.append(BTreeNode(lows[low + 1:high], level[low:high]))
+                parent_lows.append(lows[low])
+            level = parents
+            lows = parent_lows
+
+        tree.root = level[0]
+        tree.size = len(keys)
+        return tree
+
+    @classmethod
+    def from_iterable(cls, keys, fanout=64):
+        return cls.from_sorted(sorted(keys), fanout)
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, key):
+        return self.find(key) is not None
+
+    def find(self, key):
+        # Лист, в котором лежит key, или None
+        if Stats.current is not None:
+            Stats.current.add('finds')
+            Stats.current.add('visited', self.height())
+        node = self.root
+        while node.children is not None:
+            node = node.children[bisect_right(node.keys, key)]
+
+        keys = node.keys
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            return node
+        return None
+
+    def insert(self, key):
+        path = []
+        node = self.root
+        while node.children is not None:
+            i = bisect_right(node.keys, key)
+            path.append((node, i))
+            node = node.children[i]
+
+        keys = node.keys
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            return
+        keys.insert(i, key)
+        self.size += 1
+
+        if len(keys) > self.max_keys:
+            self.split(node, path)
+
+    def split(self, node, path):
+        # Переполненный узел делится пополам, разделитель поднимается в родителя - и так вверх по пути.
+        while len(node.keys) > self.max_keys:
+            if Stats.current is not None:
+                Stats.current.add('splits')
+            middle = len(node.keys) // 2
+            if node.children is None:
+                right = BTreeNode(node.keys[middle:])
+                separator = right.keys[0]
+                del node.keys[middle:]
+                right.next = node.next
+                node.next = right
+            else:
+                right = BTreeNode(node.keys[middle + 1:], node.children[middle + 1:])
+                separator = node.keys[middle]
+                del node.keys[middle:]
+                del node.children[middle + 1:]
+
+            if not path:
+                self.root = BTreeNode([separator], [node, right])
+                return
+
+            node, i = path.pop()
+            node.keys.insert(i, separator)
+            node.children.insert(i + 1, right)
+
+    def delete(self, key):
+        path = []
+        node = self.root
+        while node.children is not None:
+            i = bisect_right(node.keys, key)
+            path.append((node, i))
+            node = node.children[i]
+
+        keys = node.keys
+        i = bisect_left(keys, key)
+        if i == len(keys) or keys[i] != key:
+            return
+        del keys[i]
+        self.size -= 1
+
+        while path and len(node.keys) < self.min_keys:
+            parent, i = path.pop()
+            self.rebalance(parent, i)
+            node = parent
+
+        root = self.root
+        if root.children is not None and not root.keys:
+            self.root = root.children[0]
+
+    def rebalance(self, parent, i):
+        # children[i] недозаполнен: берем ключ у соседа, а если у соседей лишних нет - сливаем с одним из них.
+        if Stats.current is not None:
+            Stats.current.add('rebalances')
+        children = parent.children
+        node = children[i]
+
+        if i > 0 and len(children[i - 1].keys) > self.min_keys:
+            left = children[i - 1]
+            if node.children is None:
+                node.keys.insert(0, left.keys.pop())
+                parent.keys[i - 1] = node.keys[0]
+            else:
+                node.keys.insert(0, parent.keys[i - 1])
+                node.children.insert(0, left.children.pop())
+                parent.keys[i - 1] = left.keys.pop()
+            return
+
+        if i + 1 < len(children) and len(children[i + 1].keys) > self.min_keys:
+            right = children[i + 1]
+            if node.children is None:
+                node.keys.append(right.keys.pop(0))
+                parent.keys[i] = right.keys[0]
+            else:
+                node.keys.append(parent.keys[i])
+                node.children.append(right.children.pop(0))
+                parent.keys[i] = right.keys.pop(0)
+            return
+
+        if i > 0:
+            i -= 1
+        left, right = children[i], children[i + 1]
+        if left.children is None:
+            left.keys.extend(right.keys)
+            left.next = right.next
+        else:
+            left.keys.append(parent.keys[i])
+            left.keys.extend(right.keys)
+            left.children.extend(right.children)
+        del parent.keys[i]
+        del children[i + 1]
+
+    def first_leaf(self):
+        node = self.root
+        while node.children is not None:
+            node = node.children[0]
+        return node
+
+    def iter_in_order(self):
+        # Обход по цепочке листьев, без стека
+        node = self.first_leaf()
+        while node is not None:
+            yield from node.keys
+            node = node.next
+
+    def range(self, low, high, inclusive=True):
+        low_inclusive, high_inclusive = Traversal.bounds(inclusive)
+        node = self.root
+        while node.children is not None:
+            node = node.children[bisect_right(node.keys, low)]
+
+        i = bisect_left(node.keys, low) if low_inclusive else bisect_right(node.keys, low)
+        while node is not None:
+            keys = node.keys
+            end = bisect_right(keys, high) if high_inclusive else bisect_left(keys, high)
+            yield from keys[i:end]
+            if end < len(keys):
+                return
+            node = node.next
+            i = 0
+
+    def count_range(self, low, high, inclusive=True):
+        return sum(1 for _ in self.range(low, high, inclusive))
+
+    def height(self):
+        # Число уровней; у пустого дерева 0
+        if not self.size:
+            return 0
+        height = 1
+        node = self.root
+        while node.children is not None:
+            node = node.children[0]
+            height += 1
+        return height
+
+    def nodes(self):
+        count = 0
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            count += 1
+            if node.children is not None:
+                stack.extend(node.children)
+        return count
+
+    def print_tree(self, node, level=0, prefix="Root: "):
+        if node is not None:
+            print(" " * (level * 4) + prefix + str(node.keys))
+            if node.children is not None:
+                for i, child in enumerate(node.children):
+                    self.print_tree(child, level + 1, prefix=f" |- {i}: ")
+
+
+class BTreeApp:
+    def __init__(self):
+        self.tree = BTree(fanout=4)
+        for value in random.sample(range(1, 31), 30):
+            self.tree.insert(value)
+
+    def run(self):
+        while True:
+            action = input("Выберите действие:\n1. Вставить ключ\n2. Удалить ключ\n3. Найти ключ\n4. Вывести дерево\n5. Выход\n")
+            if action == "1":
+                key = int(input("Введите значение для вставки: "))
+                self.tree.insert(key)
+                print(f"Вставлено: {key}")
+            elif action == "2":
+                key = int(input("Введите значение для удаления: "))
+                self.tree.delete(key)
+                print(f"Удалено: {key}")
+            elif action == "3":
+                key = int(input("Введите значение для поиска: "))
+                print("Ключ найден!" if key in self.tree else "Ключ не найден.")
+            elif action == "4":
+                print("Вывод дерева:")
+                self.tree.print_tree(self.tree.root)
+            elif action == "5":
+                break
+            else:
+                print("Пожалуйста, введите корректное действие.")
+
+
+if __name__ == "__main__":
+    app = BTreeApp()
+    app.run()
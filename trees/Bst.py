@@ -1,52 +1,278 @@
+import os
 import random
+import sys
+
+if __package__ in (None, ""):
+    # Запуск файлом (python trees/Bst.py): пакет trees ищется от корня репозитория
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trees import Cursor, Snapshot, Stats, Traversal
 
 class TreeNode:
+    __slots__ = ('key', 'left', 'right', 'count')
+
     def __init__(self, key):
         self.key = key
         self.left = None
         self.right = None
+        # Кратность ключа; больше 1 бывает только в режиме multiset
+        self.count = 1
 
 class BinarySearchTree:
+    def __init__(self, multiset=False):
+        # В режиме multiset равные ключи не добавляют узлов, а увеличивают count у существующего.
+        self.multiset = multiset
+        # Максимальная глубина известна для корня depth_root, пока не выставлен dirty.
+        self.depth_root = None
+        self.max_depth = 0
+        self.dirty = False
+        # Замороженный индекс для пакетного поиска и корень, по которому он построен.
+        self.frozen = None
+        self.frozen_root = None
+
     def insert(self, node, key):
+        self.thaw()
         if node is None:
-            return TreeNode(key)
+            new_node = TreeNode(key)
+            self.depth_root = new_node
+            self.max_depth = 1
+            self.dirty = False
+            return new_node
 
-        if key < node.key:
-            node.left = self.insert(node.left, key)
-        else:
-            node.right = self.insert(node.right, key)
+        current = node
+        depth = 2
+        while True:
+            if self.multiset and key == current.key:
+                current.count += 1
+                return node
+            if key < current.key:
+                if current.left is None:
+                    current.left = TreeNode(key)
+                    break
+                current = current.left
+            else:
+                if current.right is None:
+                    current.right = TreeNode(key)
+                    break
+                current = current.right
+            depth += 1
+
+        if node is not self.depth_root:
+            self.depth_root = node
+            self.dirty = True
+        elif depth > self.max_depth:
+            self.max_depth = depth
 
         return node
 
+    def insert_at_path(self, root, path, key):
+        # Вставка от курсора: path - узлы от корня до текущего. Узлы BST не поворачиваются,
+        # поэтому путь остается верным: подъем по нему идет только до первого предка, поддерево
+        # которого покрывает key, и спуск - уже оттуда. Список path дописывается на месте;
+        # возвращаются корень и он же - путь до узла с key.
+        if root is None:
+            root = self.insert(None, key)
+            return root, [root]
+
+        start = len(path) - 1
+        right = bool(path) and key >= path[-1].key
+        while start > 0:
+            parent = path[start - 1]
+            if right and path[start] is parent.left and key < parent.key:
+                break
+            # В multiset равный ключ уже лежит в предке, от которого путь ушел вправо
+            if not right and path[start] is parent.right and (
+                    key > parent.key or key == parent.key and not self.multiset):
+                break
+            start -= 1
+
+        self.thaw()
+        current = path[start] if path else root
+        del path[max(start, 0):]
+        while True:
+            path.append(current)
+            if self.multiset and key == current.key:
+                current.count += 1
+                return root, path
+            if key < current.key:
+                if current.left is None:
+                    current.left = TreeNode(key)
+                    path.append(current.left)
+                    break
+                current = current.left
+            else:
+                if current.right is None:
+                    current.right = TreeNode(key)
+                    path.append(current.right)
+                    break
+                current = current.right
+
+        if root is not self.depth_root:
+            self.depth_root = root
+            self.dirty = True
+        elif len(path) > self.max_depth:
+            self.max_depth = len(path)
+
+        return root, path
+
     def find(self, node, key):
-        if node is None or node.key == key:
-            return node
-        
-        if key < node.key:
-            return self.find(node.left, key)
-                                    
-        return self.find(node.right, key)
+        if Stats.current is not None:
+            Stats.current.count_find(node, key)
+        while node is not None and node.key != key:
+            node = node.left if key < node.key else node.right
+
+        return node
 
     def delete(self, root, key):
-        if root is None:
+        parent = None
+        node = root
+        while node is not None and node.key != key:
+            parent = node
+            node = node.left if key < node.key else node.right
+
+        if node is None:
+            return root
+
+        # В режиме multiset удаляется одна копия ключа
+        if node.count > 1:
+            self.thaw()
+            node.count -= 1
+            return root
+
+        return self.unlink(root, parent, node)
+
+    def remove_one(self, root, key):
+        return self.delete(root, key)
+
+    def remove_all(self, root, key):
+        parent = None
+        node = root
+        while node is not None and node.key != key:
+            parent = node
+            node = node.left if key < node.key else node.right
+
+        if node is None:
             return root
+        return self.unlink(root, parent, node)
 
-        if key < root.key:
-            root.left = self.delete(root.left, key)
-        elif key > root.key:
-            root.right = self.delete(root.right, key)
-        else:  
-            if root.left is None:
-                return root.right
-            elif root.right is None:
-                return root.left
+    def count(self, node, key):
+        node = self.find(node, key)
+        return node.count if node is not None else 0
 
-            temp = self.min_value_node(root.right)
-            root.key = temp.key
-            root.right = self.delete(root.right, temp.key)
+    def elements(self, node):
+        return Traversal.elements(node)
+
+    def cursor(self, root):
+        return Cursor.PathCursor(self, root)
+
+    def unlink(self, root, parent, node):
+        # Убирает node со всеми копиями ключа; parent - его родитель или None для корня
+        self.thaw()
+        self.dirty = True
+
+        if node.left is not None and node.right is not None:
+            parent = node
+            successor = node.right
+            while successor.left is not None:
+                parent = successor
+                successor = successor.left
+
+            node.key = successor.key
+            node.count = successor.count
+            node = successor
+
+        child = node.left if node.left is not None else node.right
+
+        if parent is None:
+            self.depth_root = child
+            return child
+        if parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
 
         return root
 
+    def iter_pre_order(self, node):
+        return Traversal.pre_order(node)
+
+    def iter_in_order(self, node):
+        return Traversal.in_order(node)
+
+    def iter_post_order(self, node):
+        return Traversal.post_order(node)
+
+    def iter_bfs(self, root):
+        return Traversal.level_order(root)
+
+    def range(self, node, low, high, inclusive=True):
+        return Traversal.key_range(node, low, high, inclusive)
+
+    def count_range(self, node, low, high, inclusive=True):
+        return sum(1 for _ in self.range(node, low, high, inclusive))
+
+    @staticmethod
+    def from_sorted(keys):
+        keys = list(keys)
+
+        def build(low, high):
+            if low > high:
+                return None
+
+            middle = (low + high) // 2
+            node = TreeNode(keys[middle])
+            node.left = build(low, middle - 1)
+            node.right = build(middle + 1, high)
+            return node
+
+        return build(0, len(keys) - 1)
+
+    @staticmethod
+    def from_iterable(keys):
+        return BinarySearchTree.from_sorted(sorted(keys))
+
+    def save(self, node, path):
+        Snapshot.save(path, 'bst', node)
+
+    @staticmethod
+    def load(path):
+        # Возвращает корень дерева той же формы, что было сохранено
+        with Snapshot.open_snapshot(path, 'bst') as (keys, flags, _):
+            nodes = [TreeNode(key) for key in keys]
+            return Snapshot.link(nodes, flags)
+
+    def freeze(self, node):
+        if self.frozen is None or node is not self.frozen_root:
+            from trees.Eytzinger import FrozenIndex
+            self.thaw()
+            self.frozen = FrozenIndex(self.iter_in_order(node))
+            self.frozen_root = node
+        return self.frozen
+
+    def thaw(self):
+        if self.frozen is not None:
+            self.frozen.stale = True
+            self.frozen = None
+            self.frozen_root = None
+
+    def height(self, node):
+        if node is not self.depth_root or self.dirty:
+            self.depth_root = node
+            self.max_depth = self.measure_height(node)
+            self.dirty = False
+
+        return self.max_depth
+
+    def measure_height(self, node):
+        height = 0
+        level = [node] if node is not None else []
+
+        while level:
+            height += 1
+            level = [child for current in level for child in (current.left, current.right) if child is not None]
+
+        return height
+
     def min_value_node(self, node):
         current = node
         while current.left is not None:
@@ -55,7 +281,8 @@ class BinarySearchTree:
 
     def print_tree(self, node, level=0, prefix="Root: "):
         if node is not None:
-            print(" " * (level * 4) + prefix + str(node.key))
+            copies = f" x{node.count}" if node.count > 1 else ""
+            print(" " * (level * 4) + prefix + str(node.key) + copies)
 
             if node.right is not None: 
                 self.print_tree(node.right, level + 1, prefix=" |- R: ")
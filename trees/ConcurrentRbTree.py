@@ -0,0 +1,167 @@
+import threading
+from contextlib import contextmanager
+
+from trees.RbTree import RedBlackTree
+
+# Красно-черное дерево для нескольких потоков: чтения идут параллельно,
+# изменения (и всё, что трогает служебные поля дерева) - под исключительной блокировкой.
+
+class ReadWriteLock:
+    def __init__(self):
+        self.condition = threading.Condition(threading.Lock())
+        self.readers = 0
+        self.writer = False
+        # Ждущие писатели не пропускают новых читателей, иначе запись может не дождаться очереди.
+        self.waiting_writers = 0
+
+    def acquire_read(self):
+        with self.condition:
+            while self.writer or self.waiting_writers:
+                self.condition.wait()
+            self.readers += 1
+
+    def release_read(self):
+        with self.condition:
+            self.readers -= 1
+            if not self.readers and self.waiting_writers:
+                self.condition.notify_all()
+
+    def acquire_write(self):
+        with self.condition:
+            self.waiting_writers += 1
+            while self.writer or self.readers:
+                self.condition.wait()
+            self.waiting_writers -= 1
+            self.writer = True
+
+    def release_write(self):
+        with self.condition:
+            self.writer = False
+            self.condition.notify_all()
+
+    @contextmanager
+    def reading(self):
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def writing(self):
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class ConcurrentRedBlackTree:
+    def __init__(self, tree=None, multiset=False):
+        self.tree = tree if tree is not None else RedBlackTree(multiset)
+        self.NIL_LEAF = self.tree.NIL_LEAF
+        self.lock = ReadWriteLock()
+
+    @classmethod
+    def from_iterable(cls, keys, multiset=False):
+        return cls(RedBlackTree.from_iterable(keys, multiset))
+
+    def find(self, key):
+        # Самая частая операция: блокировка берется без contextmanager.
+        lock = self.lock
+        lock.acquire_read()
+        try:
+            return self.tree.find(key)
+        finally:
+            lock.release_read()
+
+    def __contains__(self, key):
+        return self.find(key) != self.NIL_LEAF
+
+    def __len__(self):
+        with self.lock.reading():
+            return len(self.tree)
+
+    def count(self, key):
+        with self.lock.reading():
+            return self.tree.count(key)
+
+    def select(self, k):
+        with self.lock.reading():
+            return self.tree.select(k)
+
+    def rank(self, key):
+        with self.lock.reading():
+            return self.tree.rank(key)
+
+    def range(self, low, high, inclusive=True):
+        # Ключи собираются в список под блокировкой: генератор пережил бы её.
+        with self.lock.reading():
+            return list(self.tree.range(low, high, inclusive))
+
+    def count_range(self, low, high, inclusive=True):
+        with self.lock.reading():
+            return self.tree.count_range(low, high, inclusive)
+
+    def percentile(self, p):
+        with self.lock.reading():
+            return self.tree.percentile(p)
+
+    def keys(self):
+        with self.lock.reading():
+            return list(self.tree.iter_in_order(self.tree.root))
+
+    # height(), freeze() и peek_*() могут пересчитывать служебные поля, поэтому берут блокировку записи.
+    def height(self):
+        with self.lock.writing():
+            return self.tree.height()
+
+    def freeze(self):
+        with self.lock.writing():
+            return self.tree.freeze()
+
+    def peek_min(self):
+        with self.lock.writing():
+            return self.tree.peek_min()
+
+    def peek_max(self):
+        with self.lock.writing():
+            return self.tree.peek_max()
+
+    def pop_min(self):
+        with self.lock.writing():
+            return self.tree.pop_min()
+
+    def pop_max(self):
+        with self.lock.writing():
+            return self.tree.pop_max()
+
+    def insert(self, key):
+        with self.lock.writing():
+            self.tree.insert(key)
+
+    def delete(self, key):
+        with self.lock.writing():
+            return self.tree.delete(key)
+
+    def remove_one(self, key):
+        with self.lock.writing():
+            return self.tree.remove_one(key)
+
+    def remove_all(self, key):
+        with self.lock.writing():
+            return self.tree.remove_all(key)
+
+    def insert_many(self, keys):
+        with self.lock.writing():
+            self.tree.insert_many(keys)
+
+    def delete_many(self, keys):
+        with self.lock.writing():
+            self.tree.delete_many(keys)
+
+    @contextmanager
+    def batch(self):
+        # Несколько изменений за одно взятие блокировки: with tree.batch() as t: t.insert(...)
+        with self.lock.writing():
+            yield self.tree
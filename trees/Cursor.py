@@ -0,0 +1,172 @@
+# Курсоры: позиция в дереве и шаги к соседним ключам в обе стороны без обхода всего дерева.
+# Новый курсор ни на чем не стоит: сначала seek(key), seek_first() или seek_last().
+# next()/prev()/seek*() возвращают ключ, на котором встал курсор, или None, если он ушел за край.
+# Изменения дерева в обход курсора (insert/delete самого дерева) делают его позицию недействительной,
+# дальше нужен seek; insert_at_cursor/delete_at_cursor позицию сохраняют. insert_at_cursor есть
+# у красно-черного дерева и BST, курсоры AVL-деревьев его не поддерживают.
+
+class RbCursor:
+    # Красно-черное дерево: шаг по указателям на родителя, O(1) в среднем на обходе.
+    def __init__(self, tree):
+        self.tree = tree
+        self.node = tree.NIL_LEAF
+
+    @property
+    def valid(self):
+        return self.node != self.tree.NIL_LEAF
+
+    @property
+    def key(self):
+        return self.node.key
+
+    def seek(self, key, inclusive=True):
+        # Первый ключ >= key (> key без inclusive)
+        self.node = self.tree.lower_bound(key, inclusive)
+        return self.node.key
+
+    def seek_first(self):
+        self.node = self.tree.first_node()
+        return self.node.key
+
+    def seek_last(self):
+        self.node = self.tree.last_node()
+        return self.node.key
+
+    def next(self):
+        if self.node != self.tree.NIL_LEAF:
+            self.node = self.tree.successor(self.node)
+        return self.node.key
+
+    def prev(self):
+        if self.node != self.tree.NIL_LEAF:
+            self.node = self.tree.predecessor(self.node)
+        return self.node.key
+
+    def insert_at_cursor(self, key):
+        # Место для key ищется от курсора, а не от корня; курсор встает на вставленный ключ
+        self.node = self.tree.insert_near(self.node, key)
+        return self.node.key
+
+    def delete_at_cursor(self):
+        # Удаляет одну копию текущего ключа; курсор переходит к следующему ключу
+        tree = self.tree
+        node = self.node
+        if node == tree.NIL_LEAF:
+            raise IndexError("Курсор не стоит на ключе")
+        if node.count > 1:
+            tree.remove_copy(node)
+            return node.key
+
+        self.node = tree.successor(node)
+        tree.delete_node(node)
+        return self.node.key
+
+    def __iter__(self):
+        while self.node != self.tree.NIL_LEAF:
+            yield self.node.key
+            self.next()
+
+
+class PathCursor:
+    # BST и AVL без указателей на родителя: курсор хранит путь от корня до текущего узла.
+    # tree - то, у чего есть insert(root, key) и delete(root, key): экземпляр BinarySearchTree
+    # или класс AVLTree / MultisetAVLTree / PersistentAVLTree. Корень после изменений через
+    # курсор - в cursor.root.
+    def __init__(self, tree, root):
+        self.tree = tree
+        self.root = root
+        self.path = []
+
+    @property
+    def valid(self):
+        return bool(self.path)
+
+    @property
+    def key(self):
+        return self.path[-1].key if self.path else None
+
+    def seek(self, key, inclusive=True):
+        path = []
+        found = 0
+        node = self.root
+        while node is not None:
+            path.append(node)
+            if node.key > key or (inclusive and node.key == key):
+                found = len(path)
+                node = node.left
+            else:
+                node = node.right
+
+        del path[found:]
+        self.path = path
+        return self.key
+
+    def descend(self, node, left):
+        path = self.path
+        while node is not None:
+            path.append(node)
+            node = node.left if left else node.right
+
+    def seek_first(self):
+        self.path = []
+        self.descend(self.root, True)
+        return self.key
+
+    def seek_last(self):
+        self.path = []
+        self.descend(self.root, False)
+        return self.key
+
+    def next(self):
+        path = self.path
+        if path:
+            node = path[-1]
+            if node.right is not None:
+                self.descend(node.right, True)
+            else:
+                child = path.pop()
+                while path and path[-1].right is child:
+                    child = path.pop()
+        return self.key
+
+    def prev(self):
+        path = self.path
+        if path:
+            node = path[-1]
+            if node.left is not None:
+                self.descend(node.left, False)
+            else:
+                child = path.pop()
+                while path and path[-1].left is child:
+                    child = path.pop()
+        return self.key
+
+    def insert_at_cursor(self, key):
+        # Место для key ищется от курсора: tree.insert_at_path поднимается по сохраненному пути
+        # только до предка, поддерево которого покрывает key; курсор встает на вставленный ключ.
+        # Такой метод есть лишь у BST: у AVL повороты перестраивают путь под курсором.
+        if not hasattr(self.tree, 'insert_at_path'):
+            raise TypeError("Вставка у курсора есть только у BST; в AVL-дереве - insert и seek")
+        self.root, self.path = self.tree.insert_at_path(self.root, self.path, key)
+        return self.key
+
+    def delete_at_cursor(self):
+        if not self.path:
+            raise IndexError("Курсор не стоит на ключе")
+        node = self.path[-1]
+        key = node.key
+        remaining = node.count > 1
+        following = self.next()
+
+        self.root = self.tree.delete(self.root, key)
+        if remaining:
+            return self.seek(key)
+        if following is None:
+            self.path = []
+            return None
+        return self.seek(following)
+
+    def __iter__(self):
+        while self.path:
+            yield self.path[-1].key
+            self.next()
@@ -0,0 +1,65 @@
+import numpy as np
+
+# Замороженный индекс для фаз только чтения: отсортированные ключи дерева лежат
+# в массиве в порядке Эйтцингера (обход в ширину, корень в ячейке 1, дети k - 2k и 2k+1),
+# и весь массив запросов спускается по нему одновременно.
+
+class FrozenIndex:
+    def __init__(self, keys):
+        keys = np.asarray(list(keys))
+        n = len(keys)
+        self.size = n
+        self.depth = n.bit_length()
+        self.stale = False
+
+        # Номер каждой ячейки при симметричном обходе полного дерева глубины depth
+        # задает ее место среди ключей; у поддерева 1..n порядок тот же.
+        positions = np.arange(1, n + 1, dtype=np.int64)
+        level = np.frexp(positions.astype(np.float64))[1].astype(np.int64) - 1
+        in_order = ((positions - (1 << level)) * 2 + 1) << (self.depth - 1 - level)
+        order = np.argsort(in_order, kind='stable') + 1
+
+        self.keys = np.empty(n + 1, dtype=keys.dtype)
+        self.keys[order] = keys
+        self.keys[0] = keys[0] if n else 0
+        self.ranks = np.full(n + 1, -1, dtype=np.int64)
+        self.ranks[order] = np.arange(n, dtype=np.int64)
+
+    def check(self):
+        if self.stale:
+            raise RuntimeError("Дерево изменилось после freeze(), индекс нужно построить заново")
+
+    def lower_bound_many(self, queries):
+        # Ячейка первого ключа >= запроса или 0, если такого ключа нет
+        self.check()
+        queries = np.asarray(queries)
+        n = self.size
+        k = np.ones(queries.shape, dtype=np.int64)
+
+        # Все уровни, кроме последнего, заполнены целиком: там проверка границы не нужна.
+        for _ in range(self.depth - 1):
+            k = 2 * k + (self.keys[k] < queries)
+
+        if self.depth:
+            inside = k <= n
+            step = 2 * k + (self.keys[np.where(inside, k, 0)] < queries)
+            k = np.where(inside, step, k)
+
+        # Отбрасываем хвост из единиц (повороты направо) и последний поворот налево.
+        lowest_zero = ~k & (k + 1)
+        return k // (2 * lowest_zero)
+
+    def contains_many(self, queries):
+        queries = np.asarray(queries)
+        k = self.lower_bound_many(queries)
+        return (k > 0) & (self.keys[k] == queries)
+
+    def find_many(self, queries):
+        # Номер ключа по возрастанию (первого из равных) или -1 для отсутствующих
+        queries = np.asarray(queries)
+        k = self.lower_bound_many(queries)
+        found = (k > 0) & (self.keys[k] == queries)
+        return np.where(found, self.ranks[k], -1)
+
+    def __len__(self):
+        return self.size
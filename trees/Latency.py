@@ -0,0 +1,137 @@
+import json
+import math
+import time
+
+# Гистограммы задержек операций. Корзины логарифмические: 16 корзин на каждую степень двойки,
+# поэтому ошибка процентиля не больше 1/16 (~6%) при любом разбросе - от сотен наносекунд
+# до секунд, а запись - пара целочисленных операций и инкремент в списке.
+# InstrumentedTree оборачивает insert/delete/find любого дерева и пишет время каждого вызова.
+
+SUB_BITS = 4
+SUB_BUCKETS = 1 << SUB_BITS
+OPERATIONS = ('insert', 'delete', 'find')
+PERCENTILES = (50, 90, 99)
+
+
+def bucket_index(ns):
+    if ns < SUB_BUCKETS:
+        return ns
+    shift = ns.bit_length() - 1 - SUB_BITS
+    return (shift + 1) * SUB_BUCKETS + (ns >> shift) - SUB_BUCKETS
+
+
+def bucket_upper(index):
+    # Наибольшее время, попадающее в корзину index
+    if index < 2 * SUB_BUCKETS:
+        return index
+    shift = index // SUB_BUCKETS - 1
+    mantissa = index % SUB_BUCKETS + SUB_BUCKETS
+    return ((mantissa + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    def __init__(self):
+        self.counts = [0] * (2 * SUB_BUCKETS)
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def record(self, ns):
+        index = bucket_index(ns)
+        counts = self.counts
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+        counts[index] += 1
+        self.count += 1
+        self.total += ns
+        if ns > self.max:
+            self.max = ns
+        if self.min is None or ns < self.min:
+            self.min = ns
+
+    def merge(self, other):
+        if len(other.counts) > len(self.counts):
+            self.counts.extend([0] * (len(other.counts) - len(self.counts)))
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+
+    def reset(self):
+        self.__init__()
+
+    def percentile(self, p):
+        # Верхняя граница корзины, в которую попадает p-й процентиль, но не больше максимума
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(p / 100 * self.count))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bucket_upper(index), self.max)
+        return self.max
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'mean_ns': self.total / self.count if self.count else None,
+            'min_ns': self.min,
+            **{f"p{p}_ns": self.percentile(p) for p in PERCENTILES},
+            'max_ns': self.max if self.count else None,
+        }
+
+
+class LatencyRecorder:
+    def __init__(self):
+        self.histograms = {}
+
+    def histogram(self, name):
+        if name not in self.histograms:
+            self.histograms[name] = LatencyHistogram()
+        return self.histograms[name]
+
+    def reset(self):
+        for histogram in self.histograms.values():
+            histogram.reset()
+
+    def summary(self):
+        return {name: histogram.summary() for name, histogram in self.histograms.items()}
+
+    def save_json(self, path):
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.summary(), file, ensure_ascii=False, indent=2)
+
+
+def timed(method, histogram):
+    clock = time.perf_counter_ns
+    record = histogram.record
+
+    def wrapper(*args, **kwargs):
+        start = clock()
+        result = method(*args, **kwargs)
+        record(clock() - start)
+        return result
+
+    return wrapper
+
+
+class InstrumentedTree:
+    # Прокси над деревом: перечисленные операции замеряются, остальное передается как есть.
+    # Подходит и для объектов (RedBlackTree(), BinarySearchTree()), и для AVLTree с его
+    # статическими методами: InstrumentedTree(AVLTree).insert(root, key).
+    def __init__(self, tree, operations=OPERATIONS, recorder=None):
+        self.tree = tree
+        self.recorder = recorder if recorder is not None else LatencyRecorder()
+        for name in operations:
+            setattr(self, name, timed(getattr(tree, name), self.recorder.histogram(name)))
+
+    def __getattr__(self, name):
+        return getattr(self.tree, name)
+
+    def __len__(self):
+        return len(self.tree)
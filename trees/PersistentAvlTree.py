@@ -0,0 +1,134 @@
+from trees import Cursor
+from trees.avlTree import AVLTree, TreeNode
+
+# Персистентное AVL-дерево: узлы после создания не меняются, вставка и удаление
+# копируют только путь от корня и возвращают новый корень. Старые корни остаются
+# целыми снимками, их можно обходить без блокировок, пока идут записи.
+# join/split тоже копируют узлы, а не переставляют их. Поиск, обходы, select/rank/range
+# наследуются от AVLTree - они ничего не меняют.
+
+class PersistentAVLTree(AVLTree):
+    @staticmethod
+    def make(key, left, right):
+        node = TreeNode(key)
+        node.left = left
+        node.right = right
+        left_height = left.height if left else 0
+        right_height = right.height if right else 0
+        node.height = 1 + (left_height if left_height > right_height else right_height)
+        node.size = 1 + (left.size if left else 0) + (right.size if right else 0)
+        return node
+
+    @staticmethod
+    def balance(key, left, right):
+        # Новый узел с ключом key над left и right, при перекосе - с поворотом
+        make = PersistentAVLTree.make
+        left_height = left.height if left else 0
+        right_height = right.height if right else 0
+
+        if left_height > right_height + 1:
+            if AVLTree.get_height(left.left) >= AVLTree.get_height(left.right):
+                return make(left.key, left.left, make(key, left.right, right))
+            middle = left.right
+            return make(middle.key, make(left.key, left.left, middle.left),
+                        make(key, middle.right, right))
+
+        if right_height > left_height + 1:
+            if AVLTree.get_height(right.right) >= AVLTree.get_height(right.left):
+                return make(right.key, make(key, left, right.left), right.right)
+            middle = right.left
+            return make(middle.key, make(key, left, middle.left),
+                        make(right.key, middle.right, right.right))
+
+        return make(key, left, right)
+
+    @staticmethod
+    def rebuild(path, child):
+        # path - пары (узел, ушли ли влево) от корня вниз, child - новое поддерево под последним узлом
+        balance = PersistentAVLTree.balance
+        for node, went_left in reversed(path):
+            if went_left:
+                child = balance(node.key, child, node.right)
+            else:
+                child = balance(node.key, node.left, child)
+        return child
+
+    @staticmethod
+    def insert(node, key):
+        path = []
+        while node:
+            went_left = key < node.key
+            path.append((node, went_left))
+            node = node.left if went_left else node.right
+
+        return PersistentAVLTree.rebuild(path, TreeNode(key))
+
+    @staticmethod
+    def delete(root, key):
+        path = []
+        node = root
+        while node and node.key != key:
+            went_left = key < node.key
+            path.append((node, went_left))
+            node = node.left if went_left else node.right
+
+        if not node:
+            return root
+
+        if node.left and node.right:
+            # Ключ заменяется преемником, из правого поддерева убирается минимум.
+            successor_path = []
+            successor = node.right
+            while successor.left:
+                successor_path.append((successor, True))
+                successor = successor.left
+
+            right = PersistentAVLTree.rebuild(successor_path, successor.right)
+            child = PersistentAVLTree.balance(successor.key, node.left, right)
+        else:
+            child = node.left if node.left else node.right
+
+        return PersistentAVLTree.rebuild(path, child)
+
+    @staticmethod
+    def join(left, key, right):
+        # Склейка без изменения left и right: копируется только спуск по краю более высокого дерева
+        left_height = left.height if left else 0
+        right_height = right.height if right else 0
+
+        if left_height > right_height + 1:
+            return PersistentAVLTree.balance(left.key, left.left,
+                                             PersistentAVLTree.join(left.right, key, right))
+        if right_height > left_height + 1:
+            return PersistentAVLTree.balance(right.key, PersistentAVLTree.join(left, key, right.left),
+                                             right.right)
+        return PersistentAVLTree.make(key, left, right)
+
+    @staticmethod
+    def join_node(left, node, right):
+        # Сам node не меняется: в результат идет его копия
+        return PersistentAVLTree.join(left, node.key, right)
+
+    @staticmethod
+    def split(root, key):
+        # (ключи меньше key, остальные ключи); root остается целым снимком
+        path = []
+        node = root
+        while node:
+            path.append(node)
+            node = node.left if key <= node.key else node.right
+
+        join = PersistentAVLTree.join
+        left = right = None
+        for node in reversed(path):
+            if key <= node.key:
+                right = join(right, node.key, node.right)
+            else:
+                left = join(node.left, node.key, left)
+
+        return left, right
+
+    @staticmethod
+    def cursor(root):
+        # Курсор вставляет и удаляет через копирование пути: снимки, с которых он начинал, не меняются
+        return Cursor.PathCursor(PersistentAVLTree, root)
@@ -1,27 +1,144 @@
+import heapq
+import math
+import os
 import random
+import sys
+from itertools import groupby
+
+if __package__ in (None, ""):
+    # Запуск файлом (python trees/RbTree.py): пакет trees ищется от корня репозитория
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trees import Cursor, SetOps, Snapshot, Stats, Traversal
+
+RED = True
+BLACK = False
 
 class TreeNode:
+    __slots__ = ('key', 'color', 'left', 'right', 'parent', 'height', 'size', 'count')
+
     def __init__(self, key):
         self.key = key
-        self.color = 'red'  
+        self.color = RED  
         self.left = None
         self.right = None
         self.parent = None
+        self.height = 1
+        self.size = 1
+        # Кратность ключа; больше 1 бывает только у дерева с multiset=True
+        self.count = 1
+
+# Один лист на все деревья, чтобы join/split могли переносить поддеревья между ними.
+# Поля листа не меняются: родитель удаленного узла передается в fix_delete явно.
+NIL_LEAF = TreeNode(None)
+NIL_LEAF.color = BLACK
+NIL_LEAF.height = 0
+NIL_LEAF.size = 0
+NIL_LEAF.count = 0
 
 class RedBlackTree:
-    def __init__(self):
-        self.NIL_LEAF = TreeNode(None)  
-        self.NIL_LEAF.color = 'black'  
+    def __init__(self, multiset=False):
+        self.NIL_LEAF = NIL_LEAF
+        # В режиме multiset равные ключи не добавляют узлов, а увеличивают count у существующего;
+        # размеры поддеревьев, select и rank считают ключи с кратностью.
+        self.multiset = multiset
         self.root = self.NIL_LEAF  
+        self.bh = 0
+        # После удалений высоты узлов пересчитываются лениво.
+        self.dirty = False
+        # Замороженный индекс для пакетного поиска, сбрасывается при любом изменении.
+        self.frozen = None
+        # Узлы с наименьшим и наибольшим ключом; None - не известны, найдутся при первом запросе.
+        self.min_node = None
+        self.max_node = None
+
+    @classmethod
+    def from_sorted(cls, keys, multiset=False):
+        tree = cls(multiset)
+        tree.load_sorted(keys)
+        return tree
+
+    @classmethod
+    def from_iterable(cls, keys, multiset=False):
+        return cls.from_sorted(sorted(keys), multiset)
+
+    def save(self, path):
+        Snapshot.save(path, 'rb', self.root, self.NIL_LEAF)
+
+    @classmethod
+    def load(cls, path):
+        tree = cls()
+        with Snapshot.open_snapshot(path, 'rb') as (keys, flags, _):
+            nodes = [TreeNode(key) for key in keys]
+            for node, flag in zip(nodes, flags):
+                if not flag & Snapshot.RED_NODE:
+                    node.color = BLACK
+            tree.root = Snapshot.link(nodes, flags, tree.NIL_LEAF, parents=True)
+
+        # В прямом порядке дети идут после родителя, поэтому размеры и высоты считаются с конца.
+        for node in reversed(nodes):
+            node.size = node.count + node.left.size + node.right.size
+            node.height = 1 + max(node.left.height, node.right.height)
+        tree.bh = tree.spine_black_height(tree.root)
+        return tree
+
+    def load_sorted(self, keys):
+        self.thaw()
+        self.min_node = self.max_node = None
+        counts = None
+        if self.multiset:
+            groups = [(key, len(list(copies))) for key, copies in groupby(keys)]
+            keys = [key for key, _ in groups]
+            counts = [count for _, count in groups]
+        else:
+            keys = list(keys)
+        # Сбалансированное дерево: все уровни, кроме последнего неполного, черные.
+        red_depth = (len(keys) + 1).bit_length() - 1
+
+        def build(low, high, depth, parent):
+            if low > high:
+                return self.NIL_LEAF
+
+            middle = (low + high) // 2
+            node = TreeNode(keys[middle])
+            if counts is not None:
+                node.count = counts[middle]
+            node.color = RED if depth == red_depth else BLACK
+            node.parent = parent
+            node.left = build(low, middle - 1, depth + 1, node)
+            node.right = build(middle + 1, high, depth + 1, node)
+            node.height = 1 + max(node.left.height, node.right.height)
+            node.size = node.count + node.left.size + node.right.size
+            return node
+
+        self.root = build(0, len(keys) - 1, 0, None)
+        self.bh = red_depth
+        self.dirty = False
 
     def insert(self, key):
         new_node = TreeNode(key)
+        self.attach(new_node, self.root)
+
+    def insert_near(self, node, key):
+        # Вставка с поиском места от node, если key не меньше его ключа; возвращает узел с key
+        start = self.root if node == self.NIL_LEAF or key < node.key else self.climb(node, key)
+        return self.attach(TreeNode(key), start)
+
+    def cursor(self):
+        return Cursor.RbCursor(self)
+
+    def attach(self, new_node, current):
+        # Спуск начинается с current: корня или узла, в поддерево которого попадает ключ.
+        self.thaw()
         new_node.left = self.NIL_LEAF
         new_node.right = self.NIL_LEAF
         parent = None
-        current = self.root
         
         while current != self.NIL_LEAF:
+            if self.multiset and new_node.key == current.key:
+                current.count += 1
+                self.grow_path(current, 1)
+                return current
             parent = current
             if new_node.key < current.key:
                 current = current.left
@@ -32,48 +149,377 @@ class RedBlackTree:
         
         if parent is None:
             self.root = new_node  
+            self.min_node = self.max_node = new_node
         elif new_node.key < parent.key:
             parent.left = new_node
+            if self.min_node is not None and new_node.key < self.min_node.key:
+                self.min_node = new_node
         else:
             parent.right = new_node
+            # равный ключ встает правее, поэтому крайним справа становится новый узел
+            if self.max_node is not None and new_node.key >= self.max_node.key:
+                self.max_node = new_node
             
-        new_node.color = 'red'  
+        new_node.color = RED  
         self.fix_insert(new_node)  
+        self.update_path(new_node)
+        return new_node
+
+    def update_path(self, node):
+        # Размеры и высоты на пути к корню; высоты только если они не помечены устаревшими.
+        if self.dirty:
+            while node is not None:
+                node.size = node.count + node.left.size + node.right.size
+                node = node.parent
+        else:
+            while node is not None:
+                node.size = node.count + node.left.size + node.right.size
+                node.height = 1 + max(node.left.height, node.right.height)
+                node = node.parent
+
+    def climb(self, node, key):
+        # Поднимается от node до первого предка, поддерево которого покрывает key >= node.key
+        parent = node.parent
+        while parent is not None and not (node == parent.left and key < parent.key):
+            node = parent
+            parent = node.parent
+
+        return node
+
+    def insert_many(self, keys):
+        keys = sorted(keys)
+        if not keys:
+            return
+
+        if len(keys) >= len(self):
+            self.load_sorted(heapq.merge(self.elements(), keys))
+            return
+
+        finger = self.NIL_LEAF
+        for key in keys:
+            new_node = TreeNode(key)
+            start = self.root if finger == self.NIL_LEAF else self.climb(finger, key)
+            finger = self.attach(new_node, start)
+
+    def delete_many(self, keys):
+        keys = sorted(keys)
+        if not keys:
+            return
+
+        if len(keys) * 2 >= len(self):
+            remaining = []
+            i = 0
+            for key in self.elements():
+                while i < len(keys) and keys[i] < key:
+                    i += 1
+                if i < len(keys) and keys[i] == key:
+                    i += 1
+                else:
+                    remaining.append(key)
+            self.load_sorted(remaining)
+            return
+
+        finger = self.NIL_LEAF
+        for key in keys:
+            node = self.NIL_LEAF
+            if finger != self.NIL_LEAF:
+                node = self._find(self.climb(finger, key), key)
+            if node == self.NIL_LEAF:
+                node = self.find(key)
+            if node == self.NIL_LEAF:
+                continue
+
+            if node.count > 1:
+                self.remove_copy(node)
+                finger = node
+            else:
+                finger = self.successor(node)
+                self.delete_node(node)
+
+    def contains_sorted(self, keys):
+        # Есть ли в дереве каждый из отсортированных keys; поиск продолжается от прошлого узла
+        found = []
+        finger = self.NIL_LEAF
+        for key in keys:
+            node = self.root if finger == self.NIL_LEAF else self.climb(finger, key)
+            last = node
+            while node != self.NIL_LEAF and key != node.key:
+                last = node
+                node = node.left if key < node.key else node.right
+
+            found.append(node != self.NIL_LEAF)
+            finger = node if node != self.NIL_LEAF else last
+
+        return found
+
+    def clear(self):
+        self.thaw()
+        self.root = self.NIL_LEAF
+        self.min_node = self.max_node = None
+        self.bh = 0
+        self.dirty = False
+
+    def take(self, other):
+        # Забирает узлы other себе, other становится пустым
+        self.thaw()
+        self.root, self.bh, self.dirty = other.root, other.bh, other.dirty
+        self.min_node, self.max_node = other.min_node, other.max_node
+        other.clear()
+
+    # Операции над множествами расходуют оба дерева (они становятся пустыми) и возвращают новое.
+    @classmethod
+    def union(cls, a, b):
+        tree = cls()
+        if not SetOps.skewed(len(a), len(b)):
+            tree.load_sorted(SetOps.union(a.iter_in_order(a.root), b.iter_in_order(b.root)))
+        else:
+            small, large = (a, b) if len(a) <= len(b) else (b, a)
+            keys = list(small.iter_in_order(small.root))
+            large.insert_many([key for key, found in zip(keys, large.contains_sorted(keys)) if not found])
+            tree.take(large)
+
+        a.clear()
+        b.clear()
+        return tree
+
+    @classmethod
+    def intersection(cls, a, b):
+        tree = cls()
+        if not SetOps.skewed(len(a), len(b)):
+            tree.load_sorted(SetOps.intersection(a.iter_in_order(a.root), b.iter_in_order(b.root)))
+        else:
+            small, large = (a, b) if len(a) <= len(b) else (b, a)
+            keys = list(small.iter_in_order(small.root))
+            tree.load_sorted(key for key, found in zip(keys, large.contains_sorted(keys)) if found)
+
+        a.clear()
+        b.clear()
+        return tree
+
+    @classmethod
+    def difference(cls, a, b):
+        # Ключи a, которых нет в b
+        tree = cls()
+        if not SetOps.skewed(len(a), len(b)):
+            tree.load_sorted(SetOps.difference(a.iter_in_order(a.root), b.iter_in_order(b.root)))
+        elif len(a) <= len(b):
+            keys = list(a.iter_in_order(a.root))
+            tree.load_sorted(key for key, found in zip(keys, b.contains_sorted(keys)) if not found)
+        else:
+            a.delete_many(list(b.iter_in_order(b.root)))
+            tree.take(a)
+
+        a.clear()
+        b.clear()
+        return tree
+
+    @classmethod
+    def symmetric_difference(cls, a, b):
+        tree = cls()
+        if not SetOps.skewed(len(a), len(b)):
+            tree.load_sorted(SetOps.symmetric_difference(a.iter_in_order(a.root), b.iter_in_order(b.root)))
+        else:
+            small, large = (a, b) if len(a) <= len(b) else (b, a)
+            keys = list(small.iter_in_order(small.root))
+            found = large.contains_sorted(keys)
+            large.delete_many([key for key, hit in zip(keys, found) if hit])
+            large.insert_many([key for key, hit in zip(keys, found) if not hit])
+            tree.take(large)
+
+        a.clear()
+        b.clear()
+        return tree
+
+    def spine_black_height(self, node):
+        # Черная высота поддерева по левому краю, за O(log n) и без пересчета высот
+        bh = 0
+        while node != self.NIL_LEAF:
+            if node.color == BLACK:
+                bh += 1
+            node = node.left
+        return bh
+
+    def join_nodes(self, left, left_bh, node, right, right_bh):
+        # Склеивает черные корни left и right через узел node; self служит рабочим деревом.
+        # Возвращает новый корень и его черную высоту.
+        if left_bh == right_bh:
+            node.left = left
+            node.right = right
+            node.parent = None
+            node.color = BLACK
+            if left != self.NIL_LEAF:
+                left.parent = node
+            if right != self.NIL_LEAF:
+                right.parent = node
+            node.size = node.count + left.size + right.size
+            node.height = 1 + max(left.height, right.height)
+            self.root = node
+            return node, left_bh + 1
+
+        # Спускаемся по краю более высокого дерева до черного узла нужной черной высоты.
+        taller_left = left_bh > right_bh
+        current = left if taller_left else right
+        parent = None
+        bh = max(left_bh, right_bh)
+        target = min(left_bh, right_bh)
+        while current.color == RED or bh != target:
+            parent = current
+            if current.color == BLACK:
+                bh -= 1
+            current = current.right if taller_left else current.left
+
+        if taller_left:
+            self.root = left
+            node.left = current
+            node.right = right
+            parent.right = node
+            if right != self.NIL_LEAF:
+                right.parent = node
+        else:
+            self.root = right
+            node.left = left
+            node.right = current
+            parent.left = node
+            if left != self.NIL_LEAF:
+                left.parent = node
+
+        node.parent = parent
+        if current != self.NIL_LEAF:
+            current.parent = node
+        node.color = RED
+        node.size = node.count + node.left.size + node.right.size
+        node.height = 1 + max(node.left.height, node.right.height)
+
+        self.bh = max(left_bh, right_bh)
+        self.fix_insert(node)
+        self.update_path(node)
+        return self.root, self.bh
+
+    @classmethod
+    def join(cls, left, key, right):
+        # Все ключи left не больше key, все ключи right не меньше; left и right становятся пустыми.
+        # В режиме multiset узел с ключом key может быть только крайним: наибольшим в left или
+        # наименьшим в right. Тогда key добавляется к его count, и этот узел становится связующим.
+        # Без multiset, как и при insert, каждая копия ключа - отдельный узел.
+        left.thaw()
+        right.thaw()
+        node = None
+        for side, edge in ((left, left.last_node()), (right, right.first_node())):
+            if not left.multiset or edge == side.NIL_LEAF or edge.key != key:
+                continue
+            side.delete_node(edge)
+            if node is None:
+                node = edge
+                node.count += 1
+            else:
+                node.count += edge.count
+        if node is None:
+            node = TreeNode(key)
+
+        tree = cls(left.multiset)
+        tree.dirty = left.dirty or right.dirty
+        root, bh = tree.join_nodes(left.root, left.spine_black_height(left.root), node,
+                                   right.root, right.spine_black_height(right.root))
+        tree.root = root
+        tree.bh = bh
+
+        left.clear()
+        right.clear()
+        return tree
+
+    def split(self, key):
+        # Ключи меньше key и остальные ключи - в два новых дерева, само дерево становится пустым.
+        self.thaw()
+        path = []
+        node = self.root
+        bh = self.spine_black_height(node)
+        while node != self.NIL_LEAF:
+            path.append((node, bh))
+            if node.color == BLACK:
+                bh -= 1
+            node = node.left if key <= node.key else node.right
+
+        workspace = type(self)(self.multiset)
+        workspace.dirty = self.dirty
+        left, left_bh = self.NIL_LEAF, 0
+        right, right_bh = self.NIL_LEAF, 0
+
+        for node, bh in reversed(path):
+            went_left = key <= node.key
+            subtree = node.right if went_left else node.left
+            subtree_bh = bh - 1 if node.color == BLACK else bh
+            if subtree != self.NIL_LEAF:
+                subtree.parent = None
+                if subtree.color == RED:
+                    subtree.color = BLACK
+                    subtree_bh += 1
+
+            if went_left:
+                right, right_bh = workspace.join_nodes(right, right_bh, node, subtree, subtree_bh)
+            else:
+                left, left_bh = workspace.join_nodes(subtree, subtree_bh, node, left, left_bh)
+
+        trees = []
+        for root, bh in ((left, left_bh), (right, right_bh)):
+            tree = type(self)(self.multiset)
+            tree.root = root
+            tree.bh = bh
+            tree.dirty = self.dirty
+            trees.append(tree)
+
+        self.clear()
+        return trees[0], trees[1]
 
     def fix_insert(self, node):
-        while node != self.root and node.parent.color == 'red':
+        # stats считает перекраски: в каждой ветке известно, сколько узлов на самом деле меняют цвет
+        stats = Stats.current
+        while node != self.root and node.parent.color == RED:
             if node.parent == node.parent.parent.left:
                 uncle = node.parent.parent.right
-                if uncle.color == 'red':  
-                    node.parent.color = 'black'
-                    uncle.color = 'black'
-                    node.parent.parent.color = 'red'
+                if uncle.color == RED:  
+                    node.parent.color = BLACK
+                    uncle.color = BLACK
+                    node.parent.parent.color = RED
                     node = node.parent.parent
+                    if stats is not None:
+                        stats.add('recolorings', 3)
                 else:  
                     if node == node.parent.right:
                         node = node.parent
                         self.left_rotate(node)  
-                    node.parent.color = 'black'
-                    node.parent.parent.color = 'red'
+                    node.parent.color = BLACK
+                    node.parent.parent.color = RED
                     self.right_rotate(node.parent.parent)  
+                    if stats is not None:
+                        stats.add('recolorings', 2)
             else:
                 uncle = node.parent.parent.left
-                if uncle.color == 'red':  
-                    node.parent.color = 'black'
-                    uncle.color = 'black'
-                    node.parent.parent.color = 'red'
+                if uncle.color == RED:  
+                    node.parent.color = BLACK
+                    uncle.color = BLACK
+                    node.parent.parent.color = RED
                     node = node.parent.parent
+                    if stats is not None:
+                        stats.add('recolorings', 3)
                 else:  
                     if node == node.parent.left:
                         node = node.parent
                         self.right_rotate(node)  
-                    node.parent.color = 'black'
-                    node.parent.parent.color = 'red'
+                    node.parent.color = BLACK
+                    node.parent.parent.color = RED
                     self.left_rotate(node.parent.parent)  
+                    if stats is not None:
+                        stats.add('recolorings', 2)
                     
-        self.root.color = 'black'  
+        if self.root.color == RED:
+            self.bh += 1
+            if stats is not None:
+                stats.add('recolorings')
+        self.root.color = BLACK  
 
     def left_rotate(self, x):
+        if Stats.current is not None:
+            Stats.current.add('rotate_left')
         y = x.right
         x.right = y.left
         
@@ -92,7 +538,14 @@ class RedBlackTree:
         y.left = x
         x.parent = y
 
+        y.size = x.size
+        x.size = x.count + x.left.size + x.right.size
+        x.height = 1 + max(x.left.height, x.right.height)
+        y.height = 1 + max(x.height, y.right.height)
+
     def right_rotate(self, y):
+        if Stats.current is not None:
+            Stats.current.add('rotate_right')
         x = y.left
         y.left = x.right
         
@@ -111,33 +564,87 @@ class RedBlackTree:
         x.right = y
         y.parent = x
 
+        x.size = y.size
+        y.size = y.count + y.left.size + y.right.size
+        y.height = 1 + max(y.left.height, y.right.height)
+        x.height = 1 + max(x.left.height, y.height)
+
     def find(self, key):
+        if Stats.current is not None:
+            Stats.current.count_find(self.root, key, self.NIL_LEAF)
         return self._find(self.root, key)
 
     def _find(self, node, key):
-        if node == self.NIL_LEAF or key == node.key:
-            return node
-        
-        if key < node.key:
-            return self._find(node.left, key)
-        
-        return self._find(node.right, key)
+        while node != self.NIL_LEAF and key != node.key:
+            node = node.left if key < node.key else node.right
+
+        return node
 
     def delete(self, key):
+        # Возвращает, был ли ключ в дереве
         z = self.find(key)
         
         if z == self.NIL_LEAF:
-            print(f"Узел с ключом {key} не найден.")
-            return
+            return False
         
+        # В режиме multiset удаляется одна копия ключа
+        if z.count > 1:
+            self.remove_copy(z)
+        else:
+            self.delete_node(z)
+        return True
+
+    def count(self, key):
+        return self.find(key).count
+
+    def remove_one(self, key):
+        return self.delete(key)
+
+    def remove_all(self, key):
+        # Удаляет ключ со всеми копиями, возвращает, сколько их было
+        z = self.find(key)
+        if z == self.NIL_LEAF:
+            return 0
+        count = z.count
+        self.delete_node(z)
+        return count
+
+    def remove_copy(self, node):
+        self.thaw()
+        node.count -= 1
+        self.grow_path(node, -1)
+
+    def grow_path(self, node, delta):
+        while node is not None:
+            node.size += delta
+            node = node.parent
+
+    def elements(self):
+        # Ключи по возрастанию с повторами по кратности
+        if not self.multiset:
+            return self.iter_in_order(self.root)
+        return Traversal.elements(self.root, self.NIL_LEAF)
+
+    def delete_node(self, z):
+        # Удаляет узел z без повторного поиска по ключу
+        self.thaw()
+        # Крайние узлы сдвигаются на соседей; у наименьшего нет левого поддерева, так что это O(1) в среднем.
+        if z is self.min_node:
+            node = self.successor(z)
+            self.min_node = node if node != self.NIL_LEAF else None
+        if z is self.max_node:
+            node = self.predecessor(z)
+            self.max_node = node if node != self.NIL_LEAF else None
         original_color_y= z.color
         
         if z.left == self.NIL_LEAF:
             x= z.right 
+            x_parent = z.parent
             self.transplant(z, z.right)
         
         elif z.right == self.NIL_LEAF:
             x= z.left 
+            x_parent = z.parent
             self.transplant(z, z.left)
         
         else:
@@ -146,9 +653,10 @@ class RedBlackTree:
             x= y.right 
             
             if y.parent == z: 
-                x.parent= y 
+                x_parent = y
                 
             else: 
+                x_parent = y.parent
                 self.transplant(y, y.right) 
                 y.right= z.right 
                 y.right.parent= y 
@@ -158,8 +666,12 @@ class RedBlackTree:
             y.left.parent= y 
             y.color= z.color 
         
-        if original_color_y == 'black':
-            self.fix_delete(x)
+        # Размеры пересчитываются от места удаления до корня: у узлов бывает кратность больше 1.
+        self.dirty = True
+        self.update_path(x_parent)
+
+        if original_color_y == BLACK:
+            self.fix_delete(x, x_parent)
 
     def transplant(self, u, v):
         if u.parent is None:
@@ -171,60 +683,266 @@ class RedBlackTree:
         else:
             u.parent.right= v 
         
-        v.parent= u.parent 
-
-    def fix_delete(self, x):
-       while x !=self.root and x.color =='black':
-           if x ==x.parent.left:  
-               w=x.parent.right  
-               if w.color =='red':  
-                   w.color ='black'  
-                   x.parent.color ='red'  
-                   self.left_rotate(x.parent)  
-                   w=x.parent.right  
-               if w.left.color=='black' and w.right.color=='black':  
-                   w.color ='red'  
-                   x=x.parent  
+        if v != self.NIL_LEAF:
+            v.parent= u.parent 
+
+    def fix_delete(self, x, parent):
+       stats = Stats.current
+       while x !=self.root and x.color ==BLACK:
+           if x ==parent.left:  
+               w=parent.right  
+               if w.color ==RED:  
+                   w.color =BLACK  
+                   parent.color =RED  
+                   self.left_rotate(parent)  
+                   w=parent.right  
+                   if stats is not None:
+                       stats.add('recolorings', 2)
+               if w.left.color==BLACK and w.right.color==BLACK:  
+                   w.color =RED  
+                   if stats is not None:
+                       stats.add('recolorings')
+                   x=parent  
+                   parent=x.parent  
                else:  
-                   if w.right.color=='black':  
-                       w.left.color='black'  
-                       w.color='red'  
+                   if w.right.color==BLACK:  
+                       w.left.color=BLACK  
+                       w.color=RED  
                        self.right_rotate(w)  
-                       w=x.parent.right  
-                   w.color=x.parent.color  
-                   x.parent.color ='black'  
-                   w.right.color ='black'  
-                   self.left_rotate(x.parent)  
+                       if stats is not None:
+                           stats.add('recolorings', 2)
+                       w=parent.right  
+                   if stats is not None:
+                       stats.add('recolorings', 3 if parent.color == RED else 1)
+                   w.color=parent.color  
+                   parent.color =BLACK  
+                   w.right.color =BLACK  
+                   self.left_rotate(parent)  
                    x=self.root  
 
            else: 
-               w=x.parent.left 
-               if w.color =='red': 
-                   w.color ='black' 
-                   x.parent.color ='red' 
-                   self.right_rotate(x.parent) 
-                   w=x.parent.left 
+               w=parent.left 
+               if w.color ==RED: 
+                   w.color =BLACK 
+                   parent.color =RED 
+                   self.right_rotate(parent) 
+                   w=parent.left 
+                   if stats is not None:
+                       stats.add('recolorings', 2)
 
-               if w.right.color=='black' and w.left.color=='black': 
-                   w.color ='red' 
-                   x=x.parent 
+               if w.right.color==BLACK and w.left.color==BLACK: 
+                   w.color =RED 
+                   if stats is not None:
+                       stats.add('recolorings')
+                   x=parent 
+                   parent=x.parent 
 
                else: 
-                   if w.left.color=='black': 
-                       w.right.color='black' 
-                       w.color='red' 
+                   if w.left.color==BLACK: 
+                       w.right.color=BLACK 
+                       w.color=RED 
                        self.left_rotate(w) 
+                       if stats is not None:
+                           stats.add('recolorings', 2)
 
-                       w=x.parent.left 
+                       w=parent.left 
 
-                   w.color=x.parent.color 
-                   x.parent.color ='black' 
-                   w.left.color ='black' 
-                   self.right_rotate(x.parent) 
+                   if stats is not None:
+                       stats.add('recolorings', 3 if parent.color == RED else 1)
+                   w.color=parent.color 
+                   parent.color =BLACK 
+                   w.left.color =BLACK 
+                   self.right_rotate(parent) 
 
                    x=self.root 
 
-       x.color='black'
+       if stats is not None and x.color == RED:
+           stats.add('recolorings')
+       x.color=BLACK
+
+    def iter_pre_order(self, node):
+        return Traversal.pre_order(node, self.NIL_LEAF)
+
+    def iter_in_order(self, node):
+        return Traversal.in_order(node, self.NIL_LEAF)
+
+    def iter_post_order(self, node):
+        return Traversal.post_order(node, self.NIL_LEAF)
+
+    def iter_bfs(self, root):
+        return Traversal.level_order(root, self.NIL_LEAF)
+
+    def __len__(self):
+        return self.root.size
+
+    def select(self, k):
+        # k-й по возрастанию ключ (с нуля) или NIL_LEAF
+        node = self.root
+        while node != self.NIL_LEAF:
+            left_size = node.left.size
+            if k < left_size:
+                node = node.left
+            elif k < left_size + node.count:
+                return node
+            else:
+                k -= left_size + node.count
+                node = node.right
+
+        return node
+
+    def count_below(self, key, inclusive=False):
+        # Количество ключей меньше key (или не больше при inclusive)
+        count = 0
+        node = self.root
+        while node != self.NIL_LEAF:
+            if key < node.key or (key == node.key and not inclusive):
+                node = node.left
+            else:
+                count += node.left.size + node.count
+                node = node.right
+
+        return count
+
+    def rank(self, key):
+        return self.count_below(key)
+
+    def successor(self, node):
+        if node.right != self.NIL_LEAF:
+            return self.min_value_node(node.right)
+
+        parent = node.parent
+        while parent is not None and node == parent.right:
+            node = parent
+            parent = parent.parent
+
+        return parent if parent is not None else self.NIL_LEAF
+
+    def predecessor(self, node):
+        if node.left != self.NIL_LEAF:
+            return self.max_value_node(node.left)
+
+        parent = node.parent
+        while parent is not None and node == parent.left:
+            node = parent
+            parent = parent.parent
+
+        return parent if parent is not None else self.NIL_LEAF
+
+    def first_node(self):
+        if self.min_node is None and self.root != self.NIL_LEAF:
+            self.min_node = self.min_value_node(self.root)
+        return self.min_node if self.min_node is not None else self.NIL_LEAF
+
+    def last_node(self):
+        if self.max_node is None and self.root != self.NIL_LEAF:
+            self.max_node = self.max_value_node(self.root)
+        return self.max_node if self.max_node is not None else self.NIL_LEAF
+
+    # Очередь с приоритетом: peek_* возвращают крайний ключ (None у пустого дерева),
+    # pop_* удаляют одну его копию по закэшированному узлу, без поиска от корня.
+    def peek_min(self):
+        return self.first_node().key
+
+    def peek_max(self):
+        return self.last_node().key
+
+    def pop_min(self):
+        return self.pop_node(self.first_node())
+
+    def pop_max(self):
+        return self.pop_node(self.last_node())
+
+    def pop_node(self, node):
+        if node == self.NIL_LEAF:
+            raise IndexError("Дерево пустое")
+        key = node.key
+        if node.count > 1:
+            self.remove_copy(node)
+        else:
+            self.delete_node(node)
+        return key
+
+    def lower_bound(self, key, inclusive=True):
+        # Первый узел с ключом >= key (> key без inclusive) или NIL_LEAF
+        result = self.NIL_LEAF
+        node = self.root
+        while node != self.NIL_LEAF:
+            if node.key > key or (inclusive and node.key == key):
+                result = node
+                node = node.left
+            else:
+                node = node.right
+
+        return result
+
+    def range(self, low, high, inclusive=True):
+        low_inclusive, high_inclusive = Traversal.bounds(inclusive)
+        node = self.lower_bound(low, low_inclusive)
+
+        while node != self.NIL_LEAF:
+            if node.key > high or (not high_inclusive and node.key == high):
+                return
+            yield node.key
+            if node.count != 1:
+                for _ in range(node.count - 1):
+                    yield node.key
+            node = self.successor(node)
+
+    def count_range(self, low, high, inclusive=True):
+        low_inclusive, high_inclusive = Traversal.bounds(inclusive)
+        count = self.count_below(high, high_inclusive) - self.count_below(low, not low_inclusive)
+        return max(count, 0)
+
+    def percentile(self, p):
+        size = len(self)
+        if not size:
+            return None
+
+        k = min(size - 1, max(0, math.ceil(p / 100 * size) - 1))
+        return self.select(k).key
+
+    def freeze(self):
+        if self.frozen is None:
+            from trees.Eytzinger import FrozenIndex
+            self.frozen = FrozenIndex(self.iter_in_order(self.root))
+        return self.frozen
+
+    def thaw(self):
+        if self.frozen is not None:
+            self.frozen.stale = True
+            self.frozen = None
+
+    def height(self):
+        if self.dirty:
+            self.recompute_heights()
+        return self.root.height
+
+    def black_height(self):
+        if self.dirty:
+            self.recompute_heights()
+        return self.bh
+
+    def recompute_heights(self):
+        stack = [self.root]
+        order = []
+        while stack:
+            node = stack.pop()
+            if node != self.NIL_LEAF:
+                order.append(node)
+                stack.append(node.left)
+                stack.append(node.right)
+
+        for node in reversed(order):
+            node.height = 1 + max(node.left.height, node.right.height)
+
+        self.bh = 0
+        node = self.root
+        while node != self.NIL_LEAF:
+            if node.color == BLACK:
+                self.bh += 1
+            node = node.left
+
+        self.dirty = False
 
     def min_value_node(self, node):
        current=node 
@@ -233,9 +951,17 @@ class RedBlackTree:
 
        return current 
 
+    def max_value_node(self, node):
+        current = node
+        while current.right != self.NIL_LEAF:
+            current = current.right
+
+        return current
+
     def print_tree(self, node, level=0, prefix="Root: "):
        if node !=self.NIL_LEAF:
-           print(" " * (level * 4) + prefix + str(node.key) + f" ({node.color})")
+           copies = f" x{node.count}" if node.count > 1 else ""
+           print(" " * (level * 4) + prefix + str(node.key) + copies + f" ({'red' if node.color == RED else 'black'})")
            if node.right !=self.NIL_LEAF:
                self.print_tree(node.right, level +1 , prefix=" |- R: ")
            if node.left !=self.NIL_LEAF:
@@ -256,8 +982,10 @@ class RedBlackTreeApp:
                self.tree.insert(key)
            elif action=="2":
                key=int(input("Введите значение для удаления: "))
-               print(f"Удалено: {key}")
-               self.tree.delete(key)
+               if self.tree.delete(key):
+                   print(f"Удалено: {key}")
+               else:
+                   print(f"Узел с ключом {key} не найден.")
            elif action=="3":
                key=int(input("Введите значение для поиска: "))
                found_node=self.tree.find(key)
@@ -0,0 +1,62 @@
+# Операции над множествами ключей для деревьев одного типа.
+# Для деревьев близкого размера - слияние отсортированных обходов за O(n + m)
+# и сборка сбалансированного дерева. Если одно дерево больше другого в SKEW раз,
+# ключи меньшего ищутся в большем подряд, от прошлого найденного места: O(m log(n/m)),
+# а само большее дерево меняется вставками и удалениями по O(log n).
+# Деревья считаются множествами: в каждом ключи без повторов, в результате тоже.
+
+SKEW = 4
+
+
+def skewed(m, n):
+    small, large = min(m, n), max(m, n)
+    return small * SKEW <= large
+
+
+def _distinct(keys):
+    missing = last = object()
+    for key in keys:
+        if last is missing or key != last:
+            last = key
+            yield key
+
+
+def _merge(a, b, keep_a, keep_both, keep_b):
+    # Общий проход по двум отсортированным последовательностям; keep_* - что оставлять
+    # из ключей только в a, в обеих и только в b.
+    a = _distinct(a)
+    b = _distinct(b)
+    missing = object()
+    x = next(a, missing)
+    y = next(b, missing)
+
+    while x is not missing or y is not missing:
+        if y is missing or (x is not missing and x < y):
+            key, keep = x, keep_a
+            x = next(a, missing)
+        elif x is missing or y < x:
+            key, keep = y, keep_b
+            y = next(b, missing)
+        else:
+            key, keep = x, keep_both
+            x = next(a, missing)
+            y = next(b, missing)
+
+        if keep:
+            yield key
+
+
+def union(a, b):
+    return _merge(a, b, True, True, True)
+
+
+def intersection(a, b):
+    return _merge(a, b, False, True, False)
+
+
+def difference(a, b):
+    return _merge(a, b, True, False, False)
+
+
+def symmetric_difference(a, b):
+    return _merge(a, b, True, False, True)
@@ -0,0 +1,128 @@
+import gc
+import mmap
+import struct
+from array import array
+from contextlib import contextmanager
+
+# Двоичный снимок дерева: заголовок, ключи в прямом порядке обхода (pre-order),
+# по байту флагов на узел (есть ли левый/правый ребенок, красный ли узел)
+# и для AVL - по байту высоты на узел. Загрузка восстанавливает форму дерева
+# как есть, без вставок и балансировки.
+
+MAGIC = b'TRSN'
+VERSION = 1
+HEADER = struct.Struct('<4sBBcxQ')
+KINDS = {'bst': 0, 'avl': 1, 'rb': 2}
+
+HAS_LEFT = 1
+HAS_RIGHT = 2
+RED_NODE = 4
+
+
+def key_typecode(keys):
+    if all(type(key) is int for key in keys):
+        if not keys or (-2 ** 63 <= min(keys) and max(keys) < 2 ** 63):
+            return 'q'
+    elif all(type(key) in (int, float) for key in keys):
+        return 'd'
+    raise ValueError("В снимок можно сохранить только целые (до 64 бит) и вещественные ключи")
+
+
+def save(path, kind, root, nil=None):
+    keys = []
+    flags = bytearray()
+    heights = bytearray()
+
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node is nil:
+            continue
+
+        if node.count != 1:
+            raise ValueError("Снимок не хранит кратности ключей дерева в режиме multiset")
+        keys.append(node.key)
+        flag = 0
+        if node.left is not nil:
+            flag |= HAS_LEFT
+        if node.right is not nil:
+            flag |= HAS_RIGHT
+        # у красно-черного дерева RED = True
+        if kind == 'rb' and node.color:
+            flag |= RED_NODE
+        flags.append(flag)
+        if kind == 'avl':
+            heights.append(node.height)
+
+        stack.append(node.right)
+        stack.append(node.left)
+
+    typecode = key_typecode(keys)
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, KINDS[kind], typecode.encode(), len(keys)))
+        file.write(array(typecode, keys).tobytes())
+        file.write(flags)
+        file.write(heights)
+
+
+@contextmanager
+def open_snapshot(path, kind):
+    # Отдает представления ключей, флагов и высот прямо поверх отображенного в память файла.
+    # Пока снимок открыт, сборщик мусора выключен: на миллионах новых узлов он втрое замедляет загрузку.
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            view = memoryview(data)
+            try:
+                magic, version, file_kind, typecode, count = HEADER.unpack_from(view)
+                if magic != MAGIC or version != VERSION:
+                    raise ValueError(f"{path}: это не снимок дерева или неизвестная версия формата")
+                if file_kind != KINDS[kind]:
+                    raise ValueError(f"{path}: снимок другого типа дерева")
+
+                typecode = typecode.decode()
+                start = HEADER.size
+                end = start + count * array(typecode).itemsize
+                keys = view[start:end].cast(typecode)
+                flags = view[end:end + count]
+                heights = view[end + count:end + 2 * count] if kind == 'avl' else None
+                try:
+                    yield keys, flags, heights
+                finally:
+                    keys.release()
+                    flags.release()
+                    if heights is not None:
+                        heights.release()
+            finally:
+                view.release()
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def link(nodes, flags, nil=None, parents=False):
+    # Узлы в прямом порядке: следующий узел - левый ребенок предыдущего, если тот его ждет,
+    # иначе правый ребенок последнего узла, ждущего правого.
+    waiting_right = []
+    waiting_left = None
+
+    for node, flag in zip(nodes, flags):
+        node.left = nil
+        node.right = nil
+        if waiting_left is not None:
+            parent = waiting_left
+            parent.left = node
+        elif waiting_right:
+            parent = waiting_right.pop()
+            parent.right = node
+        else:
+            parent = None
+        if parents:
+            node.parent = parent
+
+        waiting_left = node if flag & HAS_LEFT else None
+        if flag & HAS_RIGHT:
+            waiting_right.append(node)
+
+    return nodes[0] if nodes else nil
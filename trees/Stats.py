@@ -0,0 +1,100 @@
+from collections import Counter
+from contextlib import contextmanager
+
+# Счетчики работы деревьев: сравнения ключей, повороты, перекраски, узлы на пути поиска,
+# шаги подъема с балансировкой в AVL, разбиения и перебалансировки узлов B-дерева.
+# counting() на время блока кладет статистику в current. Деревья проверяют current там, где
+# есть что считать: в поворотах, поиске, fix_insert/fix_delete, подъеме AVL, разбиениях и
+# перебалансировках B-дерева. Вне блока это одна проверка на None, классы и узлы не меняются.
+# Сравнения считают ключи CountingKey из stats.wrap(keys): обычные ключи сравнения не считают.
+
+COUNTERS = ('comparisons', 'finds', 'visited', 'rotate_left', 'rotate_right', 'recolorings',
+            'retrace_steps', 'splits', 'rebalances')
+
+# Статистика, в которую сейчас пишут деревья, или None
+current = None
+
+
+class OperationStats:
+    def __init__(self):
+        self.counts = Counter()
+
+    def add(self, name, amount=1):
+        self.counts[name] += amount
+
+    def count_find(self, node, key, nil=None):
+        self.counts['finds'] += 1
+        self.counts['visited'] += descent(node, key, nil)
+
+    def reset(self):
+        # Сброс между фазами: например, после построения дерева перед замером поиска
+        self.counts.clear()
+
+    def snapshot(self):
+        return {name: self.counts[name] for name in COUNTERS}
+
+    def wrap(self, keys):
+        return [CountingKey(key, self) for key in keys]
+
+
+class CountingKey:
+    __slots__ = ('key', 'stats')
+
+    def __init__(self, key, stats):
+        self.key = key
+        self.stats = stats
+
+    def __lt__(self, other):
+        self.stats.counts['comparisons'] += 1
+        return self.key < (other.key if type(other) is CountingKey else other)
+
+    def __le__(self, other):
+        self.stats.counts['comparisons'] += 1
+        return self.key <= (other.key if type(other) is CountingKey else other)
+
+    def __gt__(self, other):
+        self.stats.counts['comparisons'] += 1
+        return self.key > (other.key if type(other) is CountingKey else other)
+
+    def __ge__(self, other):
+        self.stats.counts['comparisons'] += 1
+        return self.key >= (other.key if type(other) is CountingKey else other)
+
+    def __eq__(self, other):
+        self.stats.counts['comparisons'] += 1
+        return self.key == (other.key if type(other) is CountingKey else other)
+
+    def __ne__(self, other):
+        self.stats.counts['comparisons'] += 1
+        return self.key != (other.key if type(other) is CountingKey else other)
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __repr__(self):
+        return repr(self.key)
+
+
+def descent(node, key, nil=None):
+    # Число узлов на пути поиска key; сравнения этого спуска в счетчик не попадают
+    key = key.key if type(key) is CountingKey else key
+    visited = 0
+    while node is not nil:
+        visited += 1
+        node_key = node.key.key if type(node.key) is CountingKey else node.key
+        if key == node_key:
+            break
+        node = node.left if key < node_key else node.right
+    return visited
+
+
+@contextmanager
+def counting(stats):
+    # with counting(stats): ... - все AVL, красно-черные, BST и B-деревья внутри блока считают свою работу
+    global current
+    previous = current
+    current = stats
+    try:
+        yield stats
+    finally:
+        current = previous
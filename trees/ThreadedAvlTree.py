@@ -0,0 +1,172 @@
+from trees import Cursor, Traversal
+from trees.avlTree import AVLTree, TreeNode
+
+# AVL-дерево с прошивкой: каждый узел хранит соседей по порядку ключей (prev/next).
+# Повороты порядок не меняют, поэтому ссылки правятся только при вставке и удалении - O(1)
+# сверх обычной цены. Обход, диапазоны и соседние ключи - проход по списку без стека и рекурсии.
+# Поиск, select/rank, балансировка и операции над множествами (они идут через insert/delete/
+# from_sorted этого класса) наследуются от AVLTree. join/split переставляют узлы, не зная о
+# ссылках, а load собирает обычные узлы - эти методы бросают TypeError.
+
+JOIN_UNSUPPORTED = "Прошитое AVL-дерево не поддерживает join/split: ссылки prev/next не восстанавливаются"
+
+
+class ThreadedNode(TreeNode):
+    __slots__ = ('prev', 'next')
+
+    def __init__(self, key):
+        super().__init__(key)
+        self.prev = None
+        self.next = None
+
+
+class ThreadedAVLTree(AVLTree):
+    @staticmethod
+    def link(before, node, after):
+        node.prev = before
+        node.next = after
+        if before:
+            before.next = node
+        if after:
+            after.prev = node
+
+    @staticmethod
+    def insert(node, key):
+        AVLTree.thaw()
+        new_node = ThreadedNode(key)
+        if not node:
+            return new_node
+
+        path = []
+        current = node
+        while current:
+            path.append(current)
+            current = current.left if key < current.key else current.right
+
+        # Новый лист встает в списке прямо перед родителем (левый ребенок) или сразу после него (правый).
+        parent = path[-1]
+        if key < parent.key:
+            parent.left = new_node
+            ThreadedAVLTree.link(parent.prev, new_node, parent)
+        else:
+            parent.right = new_node
+            ThreadedAVLTree.link(parent, new_node, parent.next)
+
+        return AVLTree.retrace(path, 1)
+
+    @staticmethod
+    def delete(root, key):
+        path = []
+        node = root
+        while node and node.key != key:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+
+        if not node:
+            return root
+
+        # При двух детях unlink копирует в node ключ преемника и убирает из дерева сам преемник -
+        # это node.next. В обоих случаях из списка выпадает узел, который уходит из дерева.
+        removed = node.next if node.left and node.right else node
+        if removed.prev:
+            removed.prev.next = removed.next
+        if removed.next:
+            removed.next.prev = removed.prev
+
+        return AVLTree.unlink(root, path, node)
+
+    @staticmethod
+    def from_sorted(keys):
+        nodes = [ThreadedNode(key) for key in keys]
+        for before, after in zip(nodes, nodes[1:]):
+            before.next = after
+            after.prev = before
+
+        def build(low, high):
+            if low > high:
+                return None
+
+            middle = (low + high) // 2
+            node = nodes[middle]
+            node.left = build(low, middle - 1)
+            node.right = build(middle + 1, high)
+            AVLTree.update(node)
+            return node
+
+        return build(0, len(nodes) - 1)
+
+    @staticmethod
+    def from_iterable(keys):
+        return ThreadedAVLTree.from_sorted(sorted(keys))
+
+    @staticmethod
+    def join_node(left, node, right):
+        raise TypeError(JOIN_UNSUPPORTED)
+
+    @staticmethod
+    def join(left, key, right):
+        raise TypeError(JOIN_UNSUPPORTED)
+
+    @staticmethod
+    def split(root, key):
+        raise TypeError(JOIN_UNSUPPORTED)
+
+    @staticmethod
+    def load(path):
+        raise TypeError("Прошитое AVL-дерево не загружается из снимка: снимок собирается из узлов без prev/next")
+
+    @staticmethod
+    def cursor(root):
+        return Cursor.PathCursor(ThreadedAVLTree, root)
+
+    @staticmethod
+    def max_value_node(node):
+        current = node
+        while current.right is not None:
+            current = current.right
+        return current
+
+    @staticmethod
+    def successor(node):
+        return node.next
+
+    @staticmethod
+    def predecessor(node):
+        return node.prev
+
+    @staticmethod
+    def lower_bound(node, key, inclusive=True):
+        # Первый узел с ключом >= key (> key без inclusive) или None
+        result = None
+        while node:
+            if node.key > key or (inclusive and node.key == key):
+                result = node
+                node = node.left
+            else:
+                node = node.right
+
+        return result
+
+    @staticmethod
+    def iter_in_order(node):
+        if not node:
+            return
+
+        # Ключи поддерева node - отрезок списка от его наименьшего до наибольшего узла.
+        last = ThreadedAVLTree.max_value_node(node)
+        node = AVLTree.min_value_node(node)
+        while node is not last:
+            yield node.key
+            node = node.next
+        yield last.key
+
+    @staticmethod
+    def range(node, low, high, inclusive=True):
+        low_inclusive, high_inclusive = Traversal.bounds(inclusive)
+        node = ThreadedAVLTree.lower_bound(node, low, low_inclusive)
+
+        while node:
+            if node.key > high or (not high_inclusive and node.key == high):
+                return
+            yield node.key
+            node = node.next
@@ -0,0 +1,110 @@
+from collections import deque
+
+# Общие обходы для BST, AVL и красно-черного дерева: nil - пустой лист дерева
+# (None или NIL_LEAF). Ключи отдаются по одному, обход можно прервать в любой момент.
+
+def pre_order(node, nil=None):
+    stack = [node]
+
+    while stack:
+        node = stack.pop()
+        if node is not nil:
+            yield node.key
+            stack.append(node.right)
+            stack.append(node.left)
+
+
+def in_order(node, nil=None):
+    stack = []
+
+    while stack or node is not nil:
+        while node is not nil:
+            stack.append(node)
+            node = node.left
+
+        node = stack.pop()
+        yield node.key
+        node = node.right
+
+
+def post_order(node, nil=None):
+    stack = []
+    last = nil
+
+    while stack or node is not nil:
+        if node is not nil:
+            stack.append(node)
+            node = node.left
+            continue
+
+        top = stack[-1]
+        if top.right is not nil and top.right is not last:
+            node = top.right
+        else:
+            yield top.key
+            last = stack.pop()
+
+
+def elements(node, nil=None):
+    # Симметричный обход, где ключ повторяется count раз (деревья в режиме multiset)
+    stack = []
+
+    while stack or node is not nil:
+        while node is not nil:
+            stack.append(node)
+            node = node.left
+
+        node = stack.pop()
+        for _ in range(node.count):
+            yield node.key
+        node = node.right
+
+
+def level_order(node, nil=None):
+    if node is nil:
+        return
+
+    queue = deque([node])
+
+    while queue:
+        current = queue.popleft()
+        yield current.key
+
+        if current.left is not nil:
+            queue.append(current.left)
+        if current.right is not nil:
+            queue.append(current.right)
+
+
+def bounds(inclusive):
+    # inclusive - одно значение для обеих границ или пара (нижняя, верхняя)
+    if isinstance(inclusive, tuple):
+        return inclusive
+    return inclusive, inclusive
+
+
+def key_range(node, low, high, inclusive=True, nil=None):
+    low_inclusive, high_inclusive = bounds(inclusive)
+    stack = []
+
+    while node is not nil:
+        if node.key > low or (low_inclusive and node.key == low):
+            stack.append(node)
+            node = node.left
+        else:
+            node = node.right
+
+    while stack:
+        node = stack.pop()
+        if node.key > high or (not high_inclusive and node.key == high):
+            return
+        yield node.key
+        # копии ключа в режиме multiset
+        if node.count != 1:
+            for _ in range(node.count - 1):
+                yield node.key
+
+        node = node.right
+        while node is not nil:
+            stack.append(node)
+            node = node.left
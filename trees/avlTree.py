@@ -1,117 +1,467 @@
+import math
+import os
 import random
+import sys
+from itertools import groupby
+
+if __package__ in (None, ""):
+    # Запуск файлом (python trees/avlTree.py): пакет trees ищется от корня репозитория
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trees import Cursor, SetOps, Snapshot, Stats, Traversal
 
 class TreeNode:
+    __slots__ = ('key', 'left', 'right', 'height', 'size', 'count')
+
     def __init__(self, key):
         self.key = key
         self.left = None
         self.right = None
         self.height = 1
+        self.size = 1
+        # Кратность ключа; больше 1 бывает только у MultisetAVLTree
+        self.count = 1
 
 class AVLTree:
+    # Методы статические, поэтому замороженный индекс один на класс
+    # и сбрасывается при изменении любого AVL-дерева.
+    frozen = None
+    frozen_root = None
+
     @staticmethod
     def get_height(node):
         return node.height if node else 0
 
+    @staticmethod
+    def get_size(node):
+        return node.size if node else 0
+
+    @staticmethod
+    def update(node):
+        left = node.left
+        right = node.right
+        left_height = left.height if left else 0
+        right_height = right.height if right else 0
+        node.height = 1 + (left_height if left_height > right_height else right_height)
+        node.size = node.count + (left.size if left else 0) + (right.size if right else 0)
+
     @staticmethod
     def get_balance(node):
         return AVLTree.get_height(node.left) - AVLTree.get_height(node.right) if node else 0
 
     @staticmethod
     def right_rotate(y):
+        if Stats.current is not None:
+            Stats.current.add('rotate_right')
         x = y.left
         T2 = x.right
 
         x.right = y
         y.left = T2
 
-        y.height = 1 + max(AVLTree.get_height(y.left), AVLTree.get_height(y.right))
-        x.height = 1 + max(AVLTree.get_height(x.left), AVLTree.get_height(x.right))
+        AVLTree.update(y)
+        AVLTree.update(x)
         
         return x
 
     @staticmethod
     def left_rotate(x):
+        if Stats.current is not None:
+            Stats.current.add('rotate_left')
         y = x.right
         T2 = y.left
 
         y.left = x
         x.right = T2
 
-        x.height = 1 + max(AVLTree.get_height(x.left), AVLTree.get_height(x.right))
-        y.height = 1 + max(AVLTree.get_height(y.left), AVLTree.get_height(y.right))
+        AVLTree.update(x)
+        AVLTree.update(y)
         
         return y
 
+    @staticmethod
+    def rebalance(node):
+        # Вызывается для каждого узла, через который идет подъем после вставки или удаления
+        if Stats.current is not None:
+            Stats.current.add('retrace_steps')
+        balance = AVLTree.get_balance(node)
+
+        if balance > 1:
+            if AVLTree.get_balance(node.left) < 0:
+                node.left = AVLTree.left_rotate(node.left)
+            return AVLTree.right_rotate(node)
+
+        if balance < -1:
+            if AVLTree.get_balance(node.right) > 0:
+                node.right = AVLTree.right_rotate(node.right)
+            return AVLTree.left_rotate(node)
+
+        return node
+
+    @staticmethod
+    def retrace(path, delta):
+        # path - узлы от корня вниз, поддеревья которых изменились на delta ключей
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            old_height = node.height
+            AVLTree.update(node)
+
+            subtree = AVLTree.rebalance(node)
+
+            if subtree is not node:
+                if i == 0:
+                    return subtree
+
+                parent = path[i - 1]
+                if parent.left is node:
+                    parent.left = subtree
+                else:
+                    parent.right = subtree
+
+            if subtree.height == old_height:
+                # Выше высоты не меняются, остаётся поправить размеры поддеревьев.
+                for j in range(i):
+                    path[j].size += delta
+                break
+
+        return path[0]
+
     @staticmethod
     def insert(node, key):
+        AVLTree.thaw()
+        new_node = TreeNode(key)
         if not node:
-            return TreeNode(key)
+            return new_node
+
+        path = []
+        current = node
+        while current:
+            path.append(current)
+            current = current.left if key < current.key else current.right
 
-        if key < node.key:
-            node.left = AVLTree.insert(node.left, key)
+        parent = path[-1]
+        if key < parent.key:
+            parent.left = new_node
         else:
-            node.right = AVLTree.insert(node.right, key)
+            parent.right = new_node
 
-        node.height = 1 + max(AVLTree.get_height(node.left), AVLTree.get_height(node.right))
+        return AVLTree.retrace(path, 1)
 
-        balance = AVLTree.get_balance(node)
+    @staticmethod
+    def delete(root, key):
+        path = []
+        node = root
+        while node and node.key != key:
+            path.append(node)
+            node = node.left if key < node.key else node.right
 
+        if not node:
+            return root
 
-        if balance > 1 and key < node.left.key:
-            return AVLTree.right_rotate(node)
+        return AVLTree.unlink(root, path, node)
 
-        if balance < -1 and key > node.right.key:
-            return AVLTree.left_rotate(node)
+    @staticmethod
+    def unlink(root, path, node):
+        # Убирает node со всеми копиями ключа; path - узлы от корня до родителя node
+        AVLTree.thaw()
+        removed = node.count
+        if node.left and node.right:
+            path.append(node)
+            successor = node.right
+            while successor.left:
+                path.append(successor)
+                successor = successor.left
+
+            # Ниже node поддеревья теряют копии преемника, node и выше - копии удаляемого ключа.
+            if removed != successor.count:
+                for ancestor in path[:path.index(node) + 1]:
+                    ancestor.size -= removed - successor.count
+            removed = successor.count
+            node.key = successor.key
+            node.count = successor.count
+            node = successor
+
+        child = node.left if node.left else node.right
+
+        if not path:
+            return child
+
+        parent = path[-1]
+        if parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
 
-        if balance > 1 and key > node.left.key:
-            node.left = AVLTree.left_rotate(node.left)
-            return AVLTree.right_rotate(node)
+        return AVLTree.retrace(path, -removed)
 
-        if balance < -1 and key < node.right.key:
-            node.right = AVLTree.right_rotate(node.right)
-            return AVLTree.left_rotate(node)
+    @staticmethod
+    def join_node(left, node, right):
+        # Склеивает left, node и right (ключи left <= node.key <= ключи right) за O(|hl - hr| + 1)
+        left_height = AVLTree.get_height(left)
+        right_height = AVLTree.get_height(right)
+
+        if abs(left_height - right_height) <= 1:
+            node.left = left
+            node.right = right
+            AVLTree.update(node)
+            return node
 
-        return node
+        # Спускаемся по краю более высокого дерева до поддерева высоты не больше меньшей + 1.
+        taller_left = left_height > right_height
+        target = min(left_height, right_height) + 1
+        path = []
+        current = left if taller_left else right
+        while AVLTree.get_height(current) > target:
+            path.append(current)
+            current = current.right if taller_left else current.left
+
+        if taller_left:
+            node.left = current
+            node.right = right
+        else:
+            node.left = left
+            node.right = current
+        AVLTree.update(node)
+        subtree = node
+
+        for i in range(len(path) - 1, -1, -1):
+            parent = path[i]
+            if taller_left:
+                parent.right = subtree
+            else:
+                parent.left = subtree
+            AVLTree.update(parent)
+            subtree = AVLTree.rebalance(parent)
+
+        return subtree
 
     @staticmethod
-    def delete(root, key):
-        if not root:
-            return root
+    def join(left, key, right):
+        AVLTree.thaw()
+        return AVLTree.join_node(left, TreeNode(key), right)
 
-        if key < root.key:
-            root.left = AVLTree.delete(root.left, key)
-        elif key > root.key:
-            root.right = AVLTree.delete(root.right, key)
-        else:  
-            if not root.left:  
-                return root.right
-            elif not root.right:
-                return root.left
-            
-            temp = AVLTree.min_value_node(root.right)  
-            root.key = temp.key  
-            root.right = AVLTree.delete(root.right, temp.key)  
+    @staticmethod
+    def split(root, key):
+        # (ключи меньше key, остальные ключи); исходное дерево разбирается на части
+        AVLTree.thaw()
+        path = []
+        node = root
+        while node:
+            path.append(node)
+            node = node.left if key <= node.key else node.right
+
+        left = right = None
+        for node in reversed(path):
+            if key <= node.key:
+                right = AVLTree.join_node(right, node, node.right)
+            else:
+                left = AVLTree.join_node(node.left, node, left)
+
+        return left, right
 
-        root.height = 1 + max(AVLTree.get_height(root.left), AVLTree.get_height(root.right))
-        
-        balance = AVLTree.get_balance(root)
+    @staticmethod
+    def contains_sorted(root, keys):
+        # Есть ли в дереве каждый из отсортированных keys. Родительских ссылок нет,
+        # поэтому путь до прошлого узла хранится в стеке: поиск продолжается от него.
+        found = []
+        path = []
+        for key in keys:
+            while len(path) > 1 and not (path[-1] is path[-2].left and key < path[-2].key):
+                path.pop()
+
+            node = path.pop() if path else root
+            while node and node.key != key:
+                path.append(node)
+                node = node.left if key < node.key else node.right
+
+            found.append(node is not None)
+            if node:
+                path.append(node)
+
+        return found
+
+    @classmethod
+    def probe(cls, small, large):
+        # Ключи меньшего дерева и признаки, есть ли они в большем
+        keys = list(cls.iter_in_order(small))
+        return keys, cls.contains_sorted(large, keys)
+
+    @classmethod
+    def remove_all(cls, root, key):
+        # Убирает ключ целиком; у мультимножества - вместе со всеми копиями
+        return cls.delete(root, key)
+
+    # Операции над множествами разбирают a и b: после вызова пользоваться ими нельзя.
+    # Вставки и удаления идут через cls, поэтому у PersistentAVLTree a и b остаются целыми.
+    @classmethod
+    def union(cls, a, b):
+        if not SetOps.skewed(cls.get_size(a), cls.get_size(b)):
+            return cls.from_sorted(SetOps.union(cls.iter_in_order(a), cls.iter_in_order(b)))
+
+        small, large = (a, b) if cls.get_size(a) <= cls.get_size(b) else (b, a)
+        keys, found = cls.probe(small, large)
+        for key, hit in zip(keys, found):
+            if not hit:
+                large = cls.insert(large, key)
+        return large
+
+    @classmethod
+    def intersection(cls, a, b):
+        if not SetOps.skewed(cls.get_size(a), cls.get_size(b)):
+            return cls.from_sorted(SetOps.intersection(cls.iter_in_order(a), cls.iter_in_order(b)))
+
+        small, large = (a, b) if cls.get_size(a) <= cls.get_size(b) else (b, a)
+        keys, found = cls.probe(small, large)
+        return cls.from_sorted(key for key, hit in zip(keys, found) if hit)
+
+    @classmethod
+    def difference(cls, a, b):
+        # Ключи a, которых нет в b
+        if not SetOps.skewed(cls.get_size(a), cls.get_size(b)):
+            return cls.from_sorted(SetOps.difference(cls.iter_in_order(a), cls.iter_in_order(b)))
+
+        if cls.get_size(a) <= cls.get_size(b):
+            keys, found = cls.probe(a, b)
+            return cls.from_sorted(key for key, hit in zip(keys, found) if not hit)
+
+        for key in cls.iter_in_order(b):
+            a = cls.remove_all(a, key)
+        return a
+
+    @classmethod
+    def symmetric_difference(cls, a, b):
+        if not SetOps.skewed(cls.get_size(a), cls.get_size(b)):
+            return cls.from_sorted(SetOps.symmetric_difference(cls.iter_in_order(a), cls.iter_in_order(b)))
+
+        small, large = (a, b) if cls.get_size(a) <= cls.get_size(b) else (b, a)
+        keys, found = cls.probe(small, large)
+        for key, hit in zip(keys, found):
+            large = cls.remove_all(large, key) if hit else cls.insert(large, key)
+        return large
 
-        if balance > 1 and AVLTree.get_balance(root.left) >= 0:
-            return AVLTree.right_rotate(root)
+    @staticmethod
+    def select(node, k):
+        # k-й по возрастанию ключ (с нуля) или None
+        while node:
+            left_size = AVLTree.get_size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k < left_size + node.count:
+                return node
+            else:
+                k -= left_size + node.count
+                node = node.right
+
+        return None
 
-        if balance < -1 and AVLTree.get_balance(root.right) <= 0:
-            return AVLTree.left_rotate(root)
+    @staticmethod
+    def count_below(node, key, inclusive=False):
+        # Количество ключей меньше key (или не больше при inclusive)
+        count = 0
+        while node:
+            if key < node.key or (key == node.key and not inclusive):
+                node = node.left
+            else:
+                count += AVLTree.get_size(node.left) + node.count
+                node = node.right
+
+        return count
 
-        if balance > 1 and AVLTree.get_balance(root.left) < 0:
-            root.left = AVLTree.left_rotate(root.left)
-            return AVLTree.right_rotate(root)
+    @staticmethod
+    def rank(node, key):
+        return AVLTree.count_below(node, key)
 
-        if balance < -1 and AVLTree.get_balance(root.right) > 0:
-            root.right = AVLTree.right_rotate(root.right)
-            return AVLTree.left_rotate(root)
+    @staticmethod
+    def range(node, low, high, inclusive=True):
+        return Traversal.key_range(node, low, high, inclusive)
 
+    @staticmethod
+    def count_range(node, low, high, inclusive=True):
+        low_inclusive, high_inclusive = Traversal.bounds(inclusive)
+        count = AVLTree.count_below(node, high, high_inclusive) - AVLTree.count_below(node, low, not low_inclusive)
+        return max(count, 0)
+
+    @staticmethod
+    def percentile(node, p):
+        size = AVLTree.get_size(node)
+        if not size:
+            return None
+
+        k = min(size - 1, max(0, math.ceil(p / 100 * size) - 1))
+        return AVLTree.select(node, k).key
+
+    @staticmethod
+    def iter_pre_order(node):
+        return Traversal.pre_order(node)
+
+    @staticmethod
+    def iter_in_order(node):
+        return Traversal.in_order(node)
+
+    @staticmethod
+    def iter_post_order(node):
+        return Traversal.post_order(node)
+
+    @staticmethod
+    def iter_bfs(root):
+        return Traversal.level_order(root)
+
+    @staticmethod
+    def from_sorted(keys, counts=None):
+        keys = list(keys)
+
+        def build(low, high):
+            if low > high:
+                return None
+
+            middle = (low + high) // 2
+            node = TreeNode(keys[middle])
+            if counts is not None:
+                node.count = counts[middle]
+            node.left = build(low, middle - 1)
+            node.right = build(middle + 1, high)
+            AVLTree.update(node)
+            return node
+
+        return build(0, len(keys) - 1)
+
+    @staticmethod
+    def from_iterable(keys):
+        return AVLTree.from_sorted(sorted(keys))
+
+    @staticmethod
+    def save(node, path):
+        Snapshot.save(path, 'avl', node)
+
+    @staticmethod
+    def load(path):
+        with Snapshot.open_snapshot(path, 'avl') as (keys, flags, heights):
+            nodes = [TreeNode(key) for key in keys]
+            for node, height in zip(nodes, heights):
+                node.height = height
+            root = Snapshot.link(nodes, flags)
+
+        # В прямом порядке дети идут после родителя, поэтому размеры считаются с конца.
+        for node in reversed(nodes):
+            node.size = node.count + (node.left.size if node.left else 0) + (node.right.size if node.right else 0)
         return root
 
+    @staticmethod
+    def freeze(node):
+        if AVLTree.frozen is None or node is not AVLTree.frozen_root:
+            from trees.Eytzinger import FrozenIndex
+            AVLTree.thaw()
+            AVLTree.frozen = FrozenIndex(AVLTree.iter_in_order(node))
+            AVLTree.frozen_root = node
+        return AVLTree.frozen
+
+    @staticmethod
+    def thaw():
+        if AVLTree.frozen is not None:
+            AVLTree.frozen.stale = True
+            AVLTree.frozen = None
+            AVLTree.frozen_root = None
+
     @staticmethod
     def min_value_node(node):
         current = node
@@ -119,21 +469,25 @@ class AVLTree:
             current = current.left
         return current
 
+    @staticmethod
+    def cursor(root):
+        return Cursor.PathCursor(AVLTree, root)
+
     @staticmethod
     def find(node, key):
-        if not node or node.key == key:
-            return node
-        
-        if key < node.key:
-            return AVLTree.find(node.left, key)
-        
-        return AVLTree.find(node.right, key)
+        if Stats.current is not None:
+            Stats.current.count_find(node, key)
+        while node and node.key != key:
+            node = node.left if key < node.key else node.right
+
+        return node
 
     @staticmethod
     def print_tree(node, level=0, prefix="Root: "):
         
         if node is not None:
-            print(" " * (level * 4) + prefix + str(node.key))
+            copies = f" x{node.count}" if node.count > 1 else ""
+            print(" " * (level * 4) + prefix + str(node.key) + copies)
             
             if node.right is not None: 
                 AVLTree.print_tree(node.right, level + 1, prefix=" |- R: ")
@@ -141,6 +495,89 @@ class AVLTree:
             if node.left is not None: 
                 AVLTree.print_tree(node.left, level + 1, prefix=" |- L: ")
 
+class MultisetAVLTree(AVLTree):
+    # Равные ключи не добавляют узлов, а увеличивают count у существующего.
+    # Размеры поддеревьев, select, rank и range учитывают кратность.
+
+    @staticmethod
+    def insert(node, key):
+        AVLTree.thaw()
+        if not node:
+            return TreeNode(key)
+
+        path = []
+        current = node
+        while current:
+            if current.key == key:
+                current.count += 1
+                current.size += 1
+                for ancestor in path:
+                    ancestor.size += 1
+                return node
+            path.append(current)
+            current = current.left if key < current.key else current.right
+
+        parent = path[-1]
+        if key < parent.key:
+            parent.left = TreeNode(key)
+        else:
+            parent.right = TreeNode(key)
+
+        return AVLTree.retrace(path, 1)
+
+    @staticmethod
+    def delete(root, key):
+        # Убирает одну копию ключа
+        path = []
+        node = root
+        while node and node.key != key:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+
+        if not node:
+            return root
+
+        if node.count == 1:
+            return AVLTree.unlink(root, path, node)
+
+        AVLTree.thaw()
+        node.count -= 1
+        node.size -= 1
+        for ancestor in path:
+            ancestor.size -= 1
+        return root
+
+    @staticmethod
+    def remove_one(root, key):
+        return MultisetAVLTree.delete(root, key)
+
+    @staticmethod
+    def remove_all(root, key):
+        return AVLTree.delete(root, key)
+
+    @staticmethod
+    def count(node, key):
+        node = AVLTree.find(node, key)
+        return node.count if node else 0
+
+    @staticmethod
+    def elements(node):
+        return Traversal.elements(node)
+
+    @staticmethod
+    def cursor(root):
+        return Cursor.PathCursor(MultisetAVLTree, root)
+
+    @staticmethod
+    def from_sorted(keys):
+        groups = [(key, len(list(copies))) for key, copies in groupby(keys)]
+        return AVLTree.from_sorted([key for key, _ in groups], [count for _, count in groups])
+
+    @staticmethod
+    def from_iterable(keys):
+        return MultisetAVLTree.from_sorted(sorted(keys))
+
+
 class AVLTreeApp:
     def __init__(self):
         self.tree = AVLTree()